@@ -1,14 +1,284 @@
 import pandas as pd
+from pandas.api.types import union_categoricals
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
 from reportlab.lib import colors
-from reportlab.platypus import Table, TableStyle
+from reportlab.platypus import LongTable, TableStyle, Image, Paragraph, Spacer, SimpleDocTemplate
 from reportlab.lib.styles import getSampleStyleSheet
 import os
+import io
+import hashlib
+import mmap
+import shutil
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional fast CSV parser; falls back to pandas when pyarrow isn't installed
+try:
+    import pyarrow.csv as pacsv
+except ImportError:
+    pacsv = None
+
+# Parquet cache of per-file results; disabled without pyarrow
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+# Optional JIT for the grouped min/max; pandas' groupby is used without it
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Grouped min/max implementation: "pandas" (default) or "numba"
+GROUPBY_ENGINE = os.environ.get("VTBOX_GROUPBY_ENGINE", "pandas")
+
+# Rows per chunk when reading CSVs incrementally (for files larger than RAM);
+# unset or 0 reads each file in one go
+CSV_CHUNKSIZE = int(os.environ.get("VTBOX_CSV_CHUNKSIZE") or 0) or None
+
+# Line that starts the data table of a loss CSV
+HEADER_PREFIX = b"Time,Metric,Value,Measurement"
+
+# Rows inserted into the Treeview per idle callback
+TREE_INSERT_CHUNK = 1000
+
+# Where per-file results are cached between runs. Each script version has its own
+# directory: the versions cache different results, and "Clear Cache" only clears its own
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "reporting_vtbox", "1.0.3")
+
+# Columns of a cache entry (each Measurement's extreme rows)
+CACHE_COLUMNS = ["Measurement", "Percentage Loss"]
+
+if njit is not None:
+    @njit(cache=True)
+    def _gb_minmax(codes, vals, n):
+        # One pass over the values, updating the running min/max of each group
+        mins = np.full(n, np.inf, dtype=vals.dtype)
+        maxs = np.full(n, -np.inf, dtype=vals.dtype)
+        for i in range(codes.shape[0]):
+            c = codes[i]
+            v = vals[i]
+            if v < mins[c]:
+                mins[c] = v
+            if v > maxs[c]:
+                maxs[c] = v
+        return mins, maxs
+else:
+    _gb_minmax = None
+
+def group_min_max(df, keys, sort=True, engine=GROUPBY_ENGINE):
+    """
+    Min/Max of 'Percentage Loss' per group of `keys`, as 'Min Loss' / 'Max Loss' columns.
+    engine="numba" runs the compiled single-pass kernel when numba is installed.
+    """
+    if engine == "numba" and _gb_minmax is not None:
+        # Fold the key columns into one integer code per row (rows with a missing key are dropped)
+        codes = np.zeros(len(df), dtype=np.int64)
+        valid = np.ones(len(df), dtype=bool)
+        for key in keys:
+            key_codes, key_uniques = pd.factorize(df[key], sort=sort)
+            codes = codes * len(key_uniques) + key_codes
+            valid &= key_codes >= 0
+        codes, uniques = pd.factorize(codes[valid], sort=sort)
+        vals = df['Percentage Loss'].to_numpy()[valid]
+        
+        mins, maxs = _gb_minmax(codes, vals, len(uniques))
+        
+        # Take the key values from the first row of each group
+        _, first_rows = np.unique(codes, return_index=True)
+        grouped = df.loc[valid, keys].iloc[first_rows].reset_index(drop=True)
+        grouped['Min Loss'] = mins
+        grouped['Max Loss'] = maxs
+    else:
+        grouped = (
+            df.groupby(keys, sort=sort, observed=True)["Percentage Loss"]
+              .agg(['min', 'max'])
+              .rename(columns={'min': 'Min Loss', 'max': 'Max Loss'})
+              .reset_index()
+        )
+    return grouped
+
+def find_header_row(file_path):
+    """
+    Line number of the header row in file_path, or None if the file doesn't have one.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None  # mmap can't map an empty file
+        
+        # One bytes search over the mapped file instead of decoding it line by line;
+        # the whole file is searched, however long the preamble
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = mm.find(HEADER_PREFIX)
+            while pos != -1:
+                # Only a line that starts with the prefix (after optional whitespace)
+                # is the header; a preamble line may mention it further in
+                line_start = mm.rfind(b"\n", 0, pos) + 1
+                if not mm[line_start:pos].strip():
+                    return mm[:line_start].count(b"\n")
+                pos = mm.find(HEADER_PREFIX, pos + 1)
+            return None
+
+def read_loss_csv(file_path, header_row):
+    """
+    Read the Measurement / Percentage Loss columns of a CSV starting at header_row.
+    Uses pyarrow's multithreaded reader when available, otherwise pandas.
+    Either way the other columns are skipped at parse time rather than materialized.
+    """
+    if pacsv is not None:
+        table = pacsv.read_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(skip_rows=header_row, use_threads=True, block_size=8 << 20),
+            convert_options=pacsv.ConvertOptions(include_columns=["Measurement", "Percentage Loss"])
+        )
+        return table.to_pandas()
+    
+    return pd.read_csv(
+        file_path,
+        skiprows=range(0, header_row),
+        header=0,
+        usecols=["Measurement", "Percentage Loss"],
+        engine="c",
+        encoding="utf-8",
+        low_memory=False
+    )
+
+def read_loss_csv_chunks(file_path, header_row, chunksize):
+    """
+    Like read_loss_csv, but yields the rows in DataFrames of at most chunksize rows.
+    """
+    with pd.read_csv(
+        file_path,
+        skiprows=range(0, header_row),
+        header=0,
+        usecols=["Measurement", "Percentage Loss"],
+        engine="c",
+        encoding="utf-8",
+        chunksize=chunksize
+    ) as reader:
+        yield from reader
+
+def as_labels(measurement):
+    """
+    Measurement as a categorical. Without any label (no rows, or only blank ones)
+    the categories get the str dtype of text labels, so union_categoricals can
+    combine the column with those of other files.
+    """
+    labels = measurement.astype('category')
+    if len(labels.cat.categories) == 0:
+        labels = labels.cat.set_categories(pd.Index([], dtype=str))
+    return labels
+
+def clean_losses(df):
+    """
+    Coerce Percentage Loss to numbers, drop the rows where that fails
+    and make Measurement categorical for grouping.
+    """
+    # Data Cleaning. Percentage Loss stays float64: float32 would round values past
+    # ~7 significant digits (5.123456789 -> 5.123457) in the table, CSV and PDF.
+    # A categorical key groups on integer codes instead of hashing strings
+    try:
+        # Fast path: the parser already produced numbers (missing values are NaN)
+        losses = df['Percentage Loss'].astype(np.float64)
+    except (ValueError, TypeError):
+        # Stray text in the column: coerce it to NaN element by element
+        losses = pd.to_numeric(df['Percentage Loss'], errors='coerce').astype(np.float64)
+    df['Percentage Loss'] = losses
+    if losses.hasnans:
+        df.dropna(subset=['Percentage Loss'], inplace=True)
+    
+    df['Measurement'] = as_labels(df['Measurement'])
+    return df
+
+def extremes(df):
+    """
+    Reduce cleaned rows to each Measurement's min and max Percentage Loss, as two rows
+    per Measurement. Grouping these gives the same Min/Max as grouping every row.
+    """
+    reduced = df.groupby("Measurement", sort=False, observed=True)["Percentage Loss"].agg(['min', 'max'])
+    return pd.concat([reduced['min'], reduced['max']]).rename('Percentage Loss').reset_index()
+
+def _cache_path(file_path):
+    """
+    Cache file for file_path, keyed by its path, modification time and size so an
+    edited file misses. None when pyarrow isn't installed.
+    """
+    if pq is None:
+        return None
+    st = os.stat(file_path)
+    key = f"{os.path.abspath(file_path)}|{st.st_mtime_ns}|{st.st_size}"
+    return os.path.join(CACHE_DIR, hashlib.blake2b(key.encode()).hexdigest()[:16] + ".parquet")
+
+def _read_cache(cache_file):
+    """
+    The cached result in cache_file, or None if there is none or it can't be used
+    (unreadable, truncated or with other columns); the file is then processed again.
+    """
+    try:
+        df = pq.read_table(cache_file).to_pandas()
+    except (OSError, pa.ArrowException):
+        return None
+    if list(df.columns) != CACHE_COLUMNS or not all(
+        pd.api.types.is_float_dtype(df[col]) for col in CACHE_COLUMNS[1:]
+    ):
+        return None
+    # Parquet only keeps the categorical for text labels; numeric ones come back plain
+    df['Measurement'] = as_labels(df['Measurement'])
+    return df
+
+def _write_cache(df, cache_file):
+    """
+    Store df as zstd-compressed parquet. Failing to write only costs the next run a re-read.
+    """
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Write under a temporary name so a concurrent reader never sees a partial file
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), tmp_file, compression="zstd")
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+def _process_one(file_path):
+    """
+    Header scan, read and clean a single CSV file.
+    Returns its Measurement / Percentage Loss rows, or None if the header row
+    wasn't found. process_data adds the file name when combining the files.
+    Touches no Tk state, so it is safe to run in a worker thread.
+    """
+    # Reuse an earlier run's result while the file is unchanged
+    cache_file = _cache_path(file_path)
+    df = _read_cache(cache_file) if cache_file is not None and os.path.exists(cache_file) else None
+    if df is None:
+        # Attempt to locate the custom header
+        header_row = find_header_row(file_path)
+        if header_row is None:
+            return None
+        
+        if CSV_CHUNKSIZE:
+            # Read and reduce the file a chunk at a time so peak memory is bounded by
+            # the chunk size. Only each chunk's per-Measurement extremes are kept: the
+            # min/max over those equals the min/max over every row of the file
+            partials = [extremes(clean_losses(chunk)) for chunk in read_loss_csv_chunks(file_path, header_row, CSV_CHUNKSIZE)]
+            df = pd.concat(partials, ignore_index=True)
+            df['Measurement'] = as_labels(df['Measurement'])
+        else:
+            # Read the CSV from the correct header row
+            df = clean_losses(read_loss_csv(file_path, header_row))
+        
+        if cache_file is not None:
+            # Only the extremes are cached (and combined): a few rows per Measurement
+            # carry the same Min/Max as the whole file
+            df = extremes(df)
+            _write_cache(df, cache_file)
+    
+    return df[['Measurement', 'Percentage Loss']]
 
 class DataProcessorGUI:
     def __init__(self, master):
@@ -19,7 +289,13 @@ class DataProcessorGUI:
         # Initialize variables
         self.csv_files = []  # Will store multiple file paths
         self.combined_data = pd.DataFrame()
-        self.plot_path = "plot.png"
+        self.plot_png = None  # Encoded plot image for the PDF, kept in memory
+        self._insert_job = None  # Pending chunked Treeview insert
+        
+        # Bar artists of the current plot, reused while the measurements don't change
+        self._min_bars = None
+        self._max_bars = None
+        self._xcats = None
         
         # Create GUI components
         self.create_widgets()
@@ -43,6 +319,10 @@ class DataProcessorGUI:
         btn_csv = tk.Button(self.master, text="Save CSV", command=self.save_csv, bg="orange", fg="black")
         btn_csv.pack(pady=5)
         
+        # Clear Cache Button
+        btn_cache = tk.Button(self.master, text="Clear Cache", command=self.clear_cache)
+        btn_cache.pack(pady=5)
+        
         # Frame for data display
         frame_data = tk.Frame(self.master)
         frame_data.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -100,49 +380,60 @@ class DataProcessorGUI:
         self.combined_data = pd.DataFrame()
         
         try:
-            all_grouped_frames = []
+            file_names = []
+            all_raw_frames = []
 
-            # Process each CSV file one by one
-            for file_path in self.csv_files:
-                # Attempt to locate the custom header
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    header_row = None
-                    for idx, line in enumerate(f):
-                        if line.strip().startswith("Time,Metric,Value,Measurement"):
-                            header_row = idx
-                            break
-                    else:
-                        messagebox.showwarning("Warning", f"Header row not found in {os.path.basename(file_path)}. Skipped.")
-                        continue
-
-                # Read the CSV from the correct header row
-                df = pd.read_csv(
-                    file_path,
-                    skiprows=range(0, header_row),
-                    header=0,
-                    encoding="utf-8"
-                )
-                
-                # Data Cleaning
-                df['Percentage Loss'] = pd.to_numeric(df['Percentage Loss'], errors='coerce')
-                df.dropna(subset=['Percentage Loss'], inplace=True)
-                
-                # Grouping
-                grouped = df.groupby("Measurement")["Percentage Loss"].agg(['min', 'max']).reset_index()
-                grouped.rename(columns={'min': 'Min Loss', 'max': 'Max Loss'}, inplace=True)
-                
-                # Add a column to track which file the data came from
-                grouped['File Source'] = os.path.basename(file_path)
-                
-                all_grouped_frames.append(grouped)
+            # Process the CSV files concurrently; results come back in selection order
+            max_workers = min(len(self.csv_files), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(_process_one, self.csv_files))
+            
+            for file_path, raw in zip(self.csv_files, results):
+                file_name = os.path.basename(file_path)
+                if raw is None:
+                    messagebox.showwarning("Warning", f"Header row not found in {file_name}. Skipped.")
+                    continue
+                file_names.append(file_name)
+                all_raw_frames.append(raw)
             
-            # Combine all grouped data into one DataFrame
-            if all_grouped_frames:
-                self.combined_data = pd.concat(all_grouped_frames, ignore_index=True)
-            else:
+            if not all_raw_frames:
                 messagebox.showerror("Error", "No valid data processed from the selected files.")
                 return
             
+            # Build each combined column with a single numpy concatenation instead of
+            # concatenating DataFrames: the keys become category codes over the
+            # Measurement names of every file and the selected file names
+            categories = union_categoricals(
+                [raw['Measurement'] for raw in all_raw_frames], sort_categories=True
+            ).categories
+            file_categories = pd.Index(file_names).unique()
+            combined = pd.DataFrame({
+                'File Source': pd.Categorical.from_codes(
+                    np.concatenate([
+                        np.full(len(raw), file_categories.get_loc(file_name), dtype=np.int32)
+                        for file_name, raw in zip(file_names, all_raw_frames)
+                    ]),
+                    categories=file_categories
+                ),
+                'Measurement': pd.Categorical.from_codes(
+                    np.concatenate([
+                        raw['Measurement'].cat.set_categories(categories).cat.codes.to_numpy()
+                        for raw in all_raw_frames
+                    ]),
+                    categories=categories
+                ),
+                'Percentage Loss': np.concatenate([raw['Percentage Loss'].to_numpy() for raw in all_raw_frames])
+            })
+            
+            # The combined columns own their data now: release the per-file frames
+            # before grouping rather than holding them until process_data returns
+            del results, all_raw_frames, raw
+            
+            # Group the rows of every file in one pass instead of one groupby per file
+            grouped = group_min_max(combined, ["File Source", "Measurement"], sort=False)
+            del combined
+            self.combined_data = grouped[["Measurement", "Min Loss", "Max Loss", "File Source"]]
+            
             # Update Treeview
             self.update_table(self.combined_data)
             
@@ -150,7 +441,7 @@ class DataProcessorGUI:
             # Here, we demonstrate a combined plot by grouping again on Measurement.
             # If you have measurements from multiple files with the same name, they’ll be aggregated together.
             # If you want them separate, you’ll need different logic.
-            aggregated_for_plot = self.combined_data.groupby("Measurement").agg({
+            aggregated_for_plot = self.combined_data.groupby("Measurement", observed=True).agg({
                 'Min Loss': 'min',
                 'Max Loss': 'max'
             }).reset_index()
@@ -164,40 +455,72 @@ class DataProcessorGUI:
     
     def update_table(self, data):
         # Clear existing data
+        self.clear_table()
+        
+        # Insert new data as plain tuples (no per-row Series like iterrows)
+        display_cols = ['File Source', 'Measurement', 'Min Loss', 'Max Loss']
+        self.insert_rows(list(data[display_cols].itertuples(index=False, name=None)))
+    
+    def insert_rows(self, rows, start=0):
+        """
+        Inserts rows into the Treeview in chunks, yielding to the Tk event loop
+        between chunks so large results don't freeze the window.
+        """
+        end = start + TREE_INSERT_CHUNK
+        for values in rows[start:end]:
+            self.tree.insert("", tk.END, values=values)
+        
+        if end < len(rows):
+            self._insert_job = self.tree.after_idle(self.insert_rows, rows, end)
+        else:
+            self._insert_job = None
+    
+    def clear_table(self):
+        """
+        Removes all rows, including any still queued by insert_rows.
+        """
+        if self._insert_job is not None:
+            self.tree.after_cancel(self._insert_job)
+            self._insert_job = None
         for item in self.tree.get_children():
             self.tree.delete(item)
-        
-        # Insert new data
-        for _, row in data.iterrows():
-            self.tree.insert("", tk.END, values=(
-                row['File Source'],
-                row['Measurement'],
-                row['Min Loss'],
-                row['Max Loss']
-            ))
     
     def generate_plot(self, data):
-        self.ax.clear()
-        
-        import numpy as np
         x = np.arange(len(data))
         width = 0.35
+        categories = data['Measurement'].tolist()
         
-        self.ax.bar(x - width/2, data['Min Loss'], width, label='Min Loss')
-        self.ax.bar(x + width/2, data['Max Loss'], width, label='Max Loss')
-        
-        self.ax.set_xlabel('Measurement')
-        self.ax.set_ylabel('Percentage Loss')
-        self.ax.set_title('Minimum and Maximum Percentage Loss (Combined)')
-        self.ax.set_xticks(x)
-        self.ax.set_xticklabels(data['Measurement'], rotation=45, ha='right')
-        self.ax.legend()
+        if self._min_bars is not None and categories == self._xcats:
+            # Same measurements as the last plot: only the bar heights change,
+            # so keep the existing artists, ticks and legend
+            for rect, height in zip(self._min_bars, data['Min Loss']):
+                rect.set_height(height)
+            for rect, height in zip(self._max_bars, data['Max Loss']):
+                rect.set_height(height)
+            self.ax.relim()
+            self.ax.autoscale_view()
+        else:
+            self.ax.clear()
+            
+            self._min_bars = self.ax.bar(x - width/2, data['Min Loss'], width, label='Min Loss')
+            self._max_bars = self.ax.bar(x + width/2, data['Max Loss'], width, label='Max Loss')
+            
+            self.ax.set_xlabel('Measurement')
+            self.ax.set_ylabel('Percentage Loss')
+            self.ax.set_title('Minimum and Maximum Percentage Loss (Combined)')
+            self.ax.set_xticks(x)
+            self.ax.set_xticklabels(data['Measurement'], rotation=45, ha='right')
+            self.ax.legend()
+            
+            self.fig.tight_layout()
+            self._xcats = categories
         
-        self.fig.tight_layout()
-        self.canvas.draw()
+        self.canvas.draw_idle()
         
-        # Save plot as image for PDF
-        self.fig.savefig(self.plot_path)
+        # Encode the plot for the PDF in memory instead of a round-trip through disk
+        buf = io.BytesIO()
+        self.fig.savefig(buf, format='png', dpi=100)
+        self.plot_png = buf.getvalue()
     
     def generate_report(self):
         """
@@ -217,26 +540,29 @@ class DataProcessorGUI:
             if not report_path:
                 return  # User cancelled
             
-            from reportlab.pdfgen import canvas
-            from reportlab.lib.pagesizes import letter
-            c = canvas.Canvas(report_path, pagesize=letter)
-            width, height = letter
+            # Lay the report out as platypus flowables so long tables paginate
+            # instead of having to fit on a single hand-positioned canvas page
+            doc = SimpleDocTemplate(report_path, pagesize=letter)
             styles = getSampleStyleSheet()
+            elements = []
             
             # Title
-            c.setFont("Helvetica-Bold", 20)
-            c.drawCentredString(width / 2, height - 50, "Data Processing Report")
+            elements.append(Paragraph("Data Processing Report", styles['Heading1']))
+            elements.append(Spacer(1, 12))
             
             # Sub-title / Date
-            c.setFont("Helvetica", 12)
-            c.drawString(50, height - 80, f"Report generated on: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            elements.append(Paragraph(f"Report generated on: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal']))
+            elements.append(Spacer(1, 12))
 
             # We need to create a table with all columns
             # Reorganize columns for the PDF table
             display_columns = ["File Source", "Measurement", "Min Loss", "Max Loss"]
-            pdf_data = [display_columns] + self.combined_data[display_columns].values.tolist()
+            pdf_data = [display_columns] + (
+                self.combined_data[display_columns].round({'Min Loss': 4, 'Max Loss': 4}).to_numpy().tolist()
+            )
             
-            table = Table(pdf_data, colWidths=[120, 150, 80, 80])
+            # LongTable repeats the header row on every page it spans
+            table = LongTable(pdf_data, colWidths=[120, 150, 80, 80], repeatRows=1)
             table.setStyle(TableStyle([
                 ('BACKGROUND', (0,0), (-1,0), colors.grey),
                 ('TEXTCOLOR',(0,0),(-1,0),colors.whitesmoke),
@@ -246,18 +572,14 @@ class DataProcessorGUI:
                 ('BACKGROUND',(0,1),(-1,-1),colors.beige),
                 ('GRID', (0,0), (-1,-1), 1, colors.black),
             ]))
-            
-            table_width, table_height = table.wrap(0, 0)
-            table.drawOn(c, 50, height - 150 - table_height)
-            
-            # Position just below table
-            y_position = height - 160 - table_height
+            elements.append(table)
+            elements.append(Spacer(1, 12))
             
             # Add plot image if exists
-            if os.path.exists(self.plot_path):
-                c.drawImage(self.plot_path, 50, y_position - 300, width=500, height=300)
+            if self.plot_png is not None:
+                elements.append(Image(io.BytesIO(self.plot_png), width=500, height=300))
             
-            c.save()
+            doc.build(elements)
             messagebox.showinfo("Success", f"Report generated successfully at:\n{report_path}")
         
         except Exception as e:
@@ -286,6 +608,19 @@ class DataProcessorGUI:
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred while saving the CSV:\n{e}")
 
+    def clear_cache(self):
+        """
+        Deletes the cached per-file results so the next run re-reads every CSV.
+        """
+        try:
+            shutil.rmtree(CACHE_DIR)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            messagebox.showerror("Error", f"An error occurred while clearing the cache:\n{e}")
+            return
+        messagebox.showinfo("Success", "Cache cleared.")
+
 def main():
     root = tk.Tk()
     app = DataProcessorGUI(root)
@@ -1,9 +1,43 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import os
+import io
+import hashlib
+import mmap
+import shutil
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional fast CSV parser; falls back to pandas when pyarrow isn't installed
+try:
+    import pyarrow.csv as pacsv
+except ImportError:
+    pacsv = None
+
+# Parquet cache of per-file results; disabled without pyarrow
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+# Optional JIT for the grouped min/max; pandas' groupby is used without it
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Grouped min/max implementation: "pandas" (default) or "numba"
+GROUPBY_ENGINE = os.environ.get("VTBOX_GROUPBY_ENGINE", "pandas")
+
+# Rows per chunk when reading CSVs incrementally (for files larger than RAM);
+# unset or 0 reads each file in one go
+CSV_CHUNKSIZE = int(os.environ.get("VTBOX_CSV_CHUNKSIZE") or 0) or None
 
 # ReportLab imports
 from reportlab.lib.pagesizes import letter
@@ -11,6 +45,265 @@ from reportlab.pdfgen import canvas
 from reportlab.lib import colors
 from reportlab.platypus import Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.lib.utils import ImageReader
+
+# Line that starts the data table of a loss CSV
+HEADER_PREFIX = b"Time,Metric,Value,Measurement"
+
+# Rows inserted into the Treeview per idle callback
+TREE_INSERT_CHUNK = 1000
+
+# Where per-file results are cached between runs. Each script version has its own
+# directory: the versions cache different results, and "Clear Cache" only clears its own
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "reporting_vtbox", "1.0.4")
+
+# Columns of a cache entry (the grouped Min/Max per Measurement)
+CACHE_COLUMNS = ["Measurement", "Min Loss", "Max Loss"]
+
+if njit is not None:
+    @njit(cache=True)
+    def _gb_minmax(codes, vals, n):
+        # One pass over the values, updating the running min/max of each group
+        mins = np.full(n, np.inf, dtype=vals.dtype)
+        maxs = np.full(n, -np.inf, dtype=vals.dtype)
+        for i in range(codes.shape[0]):
+            c = codes[i]
+            v = vals[i]
+            if v < mins[c]:
+                mins[c] = v
+            if v > maxs[c]:
+                maxs[c] = v
+        return mins, maxs
+else:
+    _gb_minmax = None
+
+def group_min_max(df, keys, sort=True, engine=GROUPBY_ENGINE):
+    """
+    Min/Max of 'Percentage Loss' per group of `keys`, as 'Min Loss' / 'Max Loss' columns.
+    engine="numba" runs the compiled single-pass kernel when numba is installed.
+    """
+    if engine == "numba" and _gb_minmax is not None:
+        # Fold the key columns into one integer code per row (rows with a missing key are dropped)
+        codes = np.zeros(len(df), dtype=np.int64)
+        valid = np.ones(len(df), dtype=bool)
+        for key in keys:
+            key_codes, key_uniques = pd.factorize(df[key], sort=sort)
+            codes = codes * len(key_uniques) + key_codes
+            valid &= key_codes >= 0
+        codes, uniques = pd.factorize(codes[valid], sort=sort)
+        vals = df['Percentage Loss'].to_numpy()[valid]
+        
+        mins, maxs = _gb_minmax(codes, vals, len(uniques))
+        
+        # Take the key values from the first row of each group
+        _, first_rows = np.unique(codes, return_index=True)
+        grouped = df.loc[valid, keys].iloc[first_rows].reset_index(drop=True)
+        grouped['Min Loss'] = mins
+        grouped['Max Loss'] = maxs
+    else:
+        grouped = (
+            df.groupby(keys, sort=sort, observed=True)["Percentage Loss"]
+              .agg(['min', 'max'])
+              .rename(columns={'min': 'Min Loss', 'max': 'Max Loss'})
+              .reset_index()
+        )
+    return grouped
+
+def find_header_row(file_path):
+    """
+    Line number of the header row in file_path, or None if the file doesn't have one.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None  # mmap can't map an empty file
+        
+        # One bytes search over the mapped file instead of decoding it line by line;
+        # the whole file is searched, however long the preamble
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = mm.find(HEADER_PREFIX)
+            while pos != -1:
+                # Only a line that starts with the prefix (after optional whitespace)
+                # is the header; a preamble line may mention it further in
+                line_start = mm.rfind(b"\n", 0, pos) + 1
+                if not mm[line_start:pos].strip():
+                    return mm[:line_start].count(b"\n")
+                pos = mm.find(HEADER_PREFIX, pos + 1)
+            return None
+
+def read_loss_csv(file_path, header_row):
+    """
+    Read the Measurement / Percentage Loss columns of a CSV starting at header_row.
+    Uses pyarrow's multithreaded reader when available, otherwise pandas.
+    Either way the other columns are skipped at parse time rather than materialized.
+    """
+    if pacsv is not None:
+        table = pacsv.read_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(skip_rows=header_row, use_threads=True, block_size=8 << 20),
+            convert_options=pacsv.ConvertOptions(include_columns=["Measurement", "Percentage Loss"])
+        )
+        return table.to_pandas()
+    
+    return pd.read_csv(
+        file_path,
+        skiprows=range(0, header_row),
+        header=0,
+        usecols=["Measurement", "Percentage Loss"],
+        engine="c",
+        encoding="utf-8",
+        low_memory=False
+    )
+
+def read_loss_csv_chunks(file_path, header_row, chunksize):
+    """
+    Like read_loss_csv, but yields the rows in DataFrames of at most chunksize rows.
+    """
+    with pd.read_csv(
+        file_path,
+        skiprows=range(0, header_row),
+        header=0,
+        usecols=["Measurement", "Percentage Loss"],
+        engine="c",
+        encoding="utf-8",
+        chunksize=chunksize
+    ) as reader:
+        yield from reader
+
+def as_labels(measurement):
+    """
+    Measurement as a categorical. Without any label (no rows, or only blank ones)
+    the categories get the str dtype of text labels, so union_categoricals can
+    combine the column with those of other files.
+    """
+    labels = measurement.astype('category')
+    if len(labels.cat.categories) == 0:
+        labels = labels.cat.set_categories(pd.Index([], dtype=str))
+    return labels
+
+def clean_losses(df):
+    """
+    Coerce Percentage Loss to numbers, drop the rows where that fails
+    and make Measurement categorical for grouping.
+    """
+    # Data Cleaning. Percentage Loss stays float64: float32 would round values past
+    # ~7 significant digits (5.123456789 -> 5.123457) in the table, CSV and PDF.
+    # A categorical key groups on integer codes instead of hashing strings
+    try:
+        # Fast path: the parser already produced numbers (missing values are NaN)
+        losses = df['Percentage Loss'].astype(np.float64)
+    except (ValueError, TypeError):
+        # Stray text in the column: coerce it to NaN element by element
+        losses = pd.to_numeric(df['Percentage Loss'], errors='coerce').astype(np.float64)
+    df['Percentage Loss'] = losses
+    if losses.hasnans:
+        df.dropna(subset=['Percentage Loss'], inplace=True)
+    
+    df['Measurement'] = as_labels(df['Measurement'])
+    return df
+
+def _cache_path(file_path):
+    """
+    Cache file for file_path, keyed by its path, modification time and size so an
+    edited file misses. None when pyarrow isn't installed.
+    """
+    if pq is None:
+        return None
+    st = os.stat(file_path)
+    key = f"{os.path.abspath(file_path)}|{st.st_mtime_ns}|{st.st_size}"
+    return os.path.join(CACHE_DIR, hashlib.blake2b(key.encode()).hexdigest()[:16] + ".parquet")
+
+def _read_cache(cache_file):
+    """
+    The cached result in cache_file, or None if there is none or it can't be used
+    (unreadable, truncated or with other columns); the file is then processed again.
+    """
+    try:
+        df = pq.read_table(cache_file).to_pandas()
+    except (OSError, pa.ArrowException):
+        return None
+    if list(df.columns) != CACHE_COLUMNS or not all(
+        pd.api.types.is_float_dtype(df[col]) for col in CACHE_COLUMNS[1:]
+    ):
+        return None
+    # Parquet only keeps the categorical for text labels; numeric ones come back plain
+    df['Measurement'] = as_labels(df['Measurement'])
+    return df
+
+def _write_cache(df, cache_file):
+    """
+    Store df as zstd-compressed parquet. Failing to write only costs the next run a re-read.
+    """
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Write under a temporary name so a concurrent reader never sees a partial file
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), tmp_file, compression="zstd")
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+def _process_one(file_path, engine=GROUPBY_ENGINE):
+    """
+    Header scan, read, clean and group a single CSV file.
+    Returns the grouped DataFrame, or None if the header row wasn't found.
+    Touches no Tk state, so it is safe to run in a worker thread.
+    """
+    # Reuse an earlier run's result while the file is unchanged
+    cache_file = _cache_path(file_path)
+    if cache_file is not None and os.path.exists(cache_file):
+        cached = _read_cache(cache_file)
+        if cached is not None:
+            return cached
+    
+    # Locate custom header row
+    header_row = find_header_row(file_path)
+    if header_row is None:
+        return None
+    
+    if CSV_CHUNKSIZE:
+        # Group the file a chunk at a time so peak memory is bounded by the chunk
+        # size; min/max are associative, so the partial results merge in one more pass
+        partials = [
+            group_min_max(clean_losses(chunk), ["Measurement"], engine=engine)
+            for chunk in read_loss_csv_chunks(file_path, header_row, CSV_CHUNKSIZE)
+        ]
+        merged = pd.concat(partials, ignore_index=True)
+        grouped_data = merged.groupby("Measurement", observed=True).agg({'Min Loss': 'min', 'Max Loss': 'max'}).reset_index()
+    else:
+        # Read CSV from the detected header row, clean it and group by Measurement
+        df = clean_losses(read_loss_csv(file_path, header_row))
+        grouped_data = group_min_max(df, ["Measurement"], engine=engine)
+    
+    if cache_file is not None:
+        _write_cache(grouped_data, cache_file)
+    return grouped_data
+
+def render_plot_png(grouped_data, title):
+    """
+    Draw the Min/Max bar chart of grouped_data and return it encoded as PNG.
+    Uses its own Figure on an Agg canvas (no pyplot, no Tk), so it is safe
+    to run in a worker thread.
+    """
+    fig = Figure(figsize=(8,4))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    
+    x = np.arange(len(grouped_data))
+    width = 0.35
+    ax.bar(x - width/2, grouped_data['Min Loss'], width, label='Min Loss')
+    ax.bar(x + width/2, grouped_data['Max Loss'], width, label='Max Loss')
+    
+    ax.set_xlabel('Measurement')
+    ax.set_ylabel('Percentage Loss')
+    ax.set_title(title)
+    ax.set_xticks(x)
+    ax.set_xticklabels(grouped_data['Measurement'], rotation=45, ha='right')
+    ax.legend()
+    fig.tight_layout()
+    
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png')
+    return buf.getvalue()
 
 class DataProcessorGUI:
     def __init__(self, master):
@@ -21,6 +314,14 @@ class DataProcessorGUI:
         # Will store multiple file paths
         self.csv_files = []
         
+        # Pending chunked Treeview insert
+        self._insert_job = None
+        
+        # Bar artists of the current plot, reused while the measurements don't change
+        self._min_bars = None
+        self._max_bars = None
+        self._xcats = None
+        
         # Create GUI components
         self.create_widgets()
     
@@ -39,6 +340,10 @@ class DataProcessorGUI:
         btn_process = tk.Button(self.master, text="Process Data", command=self.process_data, bg="green", fg="white")
         btn_process.pack(pady=10)
         
+        # Clear Cache Button
+        btn_cache = tk.Button(self.master, text="Clear Cache", command=self.clear_cache)
+        btn_cache.pack(pady=5)
+        
         # Frame for data display
         frame_data = tk.Frame(self.master)
         frame_data.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -94,8 +399,8 @@ class DataProcessorGUI:
           - Detect header row ("Time,Metric,Value,Measurement")
           - Clean & group data
           - Update UI Treeview
-          - Generate a bar chart
-          - Automatically save CSV and PDF
+          - Automatically save CSV, bar chart PNG and PDF
+        The last file's bar chart is also shown in the window.
         """
         if not self.csv_files:
             messagebox.showerror("Error", "Please select at least one CSV file.")
@@ -103,94 +408,131 @@ class DataProcessorGUI:
         
         try:
             # Clear the Treeview from any old data
-            for item in self.tree.get_children():
-                self.tree.delete(item)
+            self.clear_table()
+            table_rows = []
             
-            for file_path in self.csv_files:
-                # 1. Locate custom header row
-                header_row = None
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    for idx, line in enumerate(f):
-                        if line.strip().startswith("Time,Metric,Value,Measurement"):
-                            header_row = idx
-                            break
+            # One timestamp for every report of this run
+            generated_on = pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
+            
+            # 1-4. Header scan, read, clean and group every file concurrently
+            max_workers = min(len(self.csv_files), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(_process_one, self.csv_files))
                 
-                if header_row is None:
-                    messagebox.showwarning(
-                        "Warning", 
-                        f"Header row not found in {os.path.basename(file_path)}. Skipped."
+                output_jobs = []
+                last_file = None
+                for file_path, grouped_data in zip(self.csv_files, results):
+                    file_name = os.path.basename(file_path)
+                    if grouped_data is None:
+                        messagebox.showwarning(
+                            "Warning", 
+                            f"Header row not found in {file_name}. Skipped."
+                        )
+                        continue
+                    
+                    # 5. Collect the Treeview rows for each file
+                    table_rows.extend(
+                        (file_name, *row)
+                        for row in grouped_data[['Measurement', 'Min Loss', 'Max Loss']].itertuples(index=False, name=None)
                     )
-                    continue
-
-                # 2. Read CSV from the detected header row
-                df = pd.read_csv(
-                    file_path,
-                    skiprows=range(0, header_row),
-                    header=0,
-                    encoding="utf-8"
-                )
-                
-                # 3. Data cleaning
-                df['Percentage Loss'] = pd.to_numeric(df['Percentage Loss'], errors='coerce')
-                df.dropna(subset=['Percentage Loss'], inplace=True)
-                
-                # 4. Group by Measurement
-                grouped_data = df.groupby("Measurement")["Percentage Loss"].agg(['min', 'max']).reset_index()
-                grouped_data.rename(columns={'min': 'Min Loss', 'max': 'Max Loss'}, inplace=True)
-                
-                # 5. Update the Treeview for each file
-                for _, row in grouped_data.iterrows():
-                    self.tree.insert("", tk.END, values=(
-                        os.path.basename(file_path),
-                        row['Measurement'],
-                        row['Min Loss'],
-                        row['Max Loss']
-                    ))
-                
-                # 6. Generate a plot for THIS file
-                self.generate_plot_for_file(grouped_data, file_path)
+                    
+                    # 6. Automatically save a CSV with processed results (in the background)
+                    output_jobs.append(executor.submit(self.save_csv_for_file, grouped_data, file_path))
+                    
+                    # 7. Render this file's plot off-screen and generate a PDF with
+                    #    table + plot (in the background)
+                    output_jobs.append(executor.submit(self.save_plot_and_pdf_for_file, grouped_data, file_path, generated_on))
+                    last_file = (grouped_data, file_path)
                 
-                # 7. Automatically save a CSV with processed results
-                self.save_csv_for_file(grouped_data, file_path)
+                # 8. Only the last file's plot is drawn on the window, once
+                if last_file is not None:
+                    self.generate_plot_for_file(*last_file)
                 
-                # 8. Automatically generate a PDF with table + plot
-                self.generate_pdf_for_file(grouped_data, file_path)
+                # Surface any error raised while writing the outputs
+                for job in output_jobs:
+                    job.result()
+            
+            # Fill the Treeview in one batch once every file is grouped
+            self.insert_rows(table_rows)
             
             messagebox.showinfo("Success", "All selected files have been processed and saved.")
         
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred while processing the data:\n{e}")
     
-    def generate_plot_for_file(self, grouped_data, file_path):
+    def insert_rows(self, rows, start=0):
         """
-        Generate and display a bar chart for the current file's grouped data,
-        then save the figure as <original_filename>_plot.png
+        Inserts rows into the Treeview in chunks, yielding to the Tk event loop
+        between chunks so large results don't freeze the window.
         """
-        self.ax.clear()
+        end = start + TREE_INSERT_CHUNK
+        for values in rows[start:end]:
+            self.tree.insert("", tk.END, values=values)
         
-        import numpy as np
+        if end < len(rows):
+            self._insert_job = self.tree.after_idle(self.insert_rows, rows, end)
+        else:
+            self._insert_job = None
+    
+    def clear_table(self):
+        """
+        Removes all rows, including any still queued by insert_rows.
+        """
+        if self._insert_job is not None:
+            self.tree.after_cancel(self._insert_job)
+            self._insert_job = None
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+    
+    def generate_plot_for_file(self, grouped_data, file_path):
+        """
+        Display a bar chart of the file's grouped data in the window.
+        """
         x = np.arange(len(grouped_data))
         width = 0.35
+        categories = grouped_data['Measurement'].tolist()
         
-        self.ax.bar(x - width/2, grouped_data['Min Loss'], width, label='Min Loss')
-        self.ax.bar(x + width/2, grouped_data['Max Loss'], width, label='Max Loss')
+        if self._min_bars is not None and categories == self._xcats:
+            # Same measurements as the previous file: only the bar heights change,
+            # so keep the existing artists, ticks and legend
+            for rect, height in zip(self._min_bars, grouped_data['Min Loss']):
+                rect.set_height(height)
+            for rect, height in zip(self._max_bars, grouped_data['Max Loss']):
+                rect.set_height(height)
+            self.ax.relim()
+            self.ax.autoscale_view()
+        else:
+            self.ax.clear()
+            
+            self._min_bars = self.ax.bar(x - width/2, grouped_data['Min Loss'], width, label='Min Loss')
+            self._max_bars = self.ax.bar(x + width/2, grouped_data['Max Loss'], width, label='Max Loss')
+            
+            self.ax.set_xlabel('Measurement')
+            self.ax.set_ylabel('Percentage Loss')
+            self.ax.set_xticks(x)
+            self.ax.set_xticklabels(grouped_data['Measurement'], rotation=45, ha='right')
+            self.ax.legend()
+            
+            self.fig.tight_layout()
+            self._xcats = categories
         
-        self.ax.set_xlabel('Measurement')
-        self.ax.set_ylabel('Percentage Loss')
         self.ax.set_title(f'Min/Max Percentage Loss - {os.path.basename(file_path)}')
-        self.ax.set_xticks(x)
-        self.ax.set_xticklabels(grouped_data['Measurement'], rotation=45, ha='right')
-        self.ax.legend()
-        
-        self.fig.tight_layout()
-        self.canvas.draw()
+        self.canvas.draw_idle()
+    
+    def save_plot_and_pdf_for_file(self, grouped_data, file_path, generated_on=None):
+        """
+        Render the file's bar chart off-screen, save it as <original_filename>_plot.png
+        and generate the PDF report embedding it. Touches no Tk state.
+        """
+        # Encode the plot once; the same bytes go to disk and into the PDF
+        plot_png = render_plot_png(grouped_data, f'Min/Max Percentage Loss - {os.path.basename(file_path)}')
         
         # Construct a plot filename (e.g., "data_plot.png")
         base_name = os.path.splitext(file_path)[0]  # full path without .csv
-        plot_file = base_name + "_plot.png"
+        with open(base_name + "_plot.png", 'wb') as f:
+            f.write(plot_png)
         
-        # Save plot as image
-        self.fig.savefig(plot_file)
+        self.generate_pdf_for_file(grouped_data, file_path, plot_png, generated_on)
     
     def save_csv_for_file(self, grouped_data, file_path):
         """
@@ -200,11 +542,16 @@ class DataProcessorGUI:
         save_path = base_name + "_processed.csv"
         grouped_data.to_csv(save_path, index=False)
     
-    def generate_pdf_for_file(self, grouped_data, file_path):
+    def generate_pdf_for_file(self, grouped_data, file_path, plot_png=None, generated_on=None):
         """
-        Generate a PDF report for each file, containing a table and the plot image.
+        Generate a PDF report for each file, containing a table and the plot image
+        (the PNG bytes from render_plot_png).
+        generated_on is the run's timestamp string; the current time if not given.
         Saves to <original_filename>_report.pdf
         """
+        if generated_on is None:
+            generated_on = pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
+        
         base_name = os.path.splitext(file_path)[0]
         pdf_path = base_name + "_report.pdf"
         
@@ -220,12 +567,13 @@ class DataProcessorGUI:
         # Sub-title / date
         c.setFont("Helvetica", 12)
         c.drawString(50, height - 80, f"Report for: {os.path.basename(file_path)}")
-        c.drawString(50, height - 100, f"Generated on: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        c.drawString(50, height - 100, f"Generated on: {generated_on}")
         
-        # Prepare table data
-        pdf_data = [["Measurement", "Min Loss", "Max Loss"]]
-        for _, row in grouped_data.iterrows():
-            pdf_data.append([row['Measurement'], row['Min Loss'], row['Max Loss']])
+        # Prepare table data: round the loss columns in one vectorized pass and
+        # convert the whole frame to rows at once instead of iterating with iterrows
+        table_cols = ["Measurement", "Min Loss", "Max Loss"]
+        pdf_data = [table_cols]
+        pdf_data.extend(grouped_data[table_cols].round({'Min Loss': 4, 'Max Loss': 4}).to_numpy().tolist())
         
         # Create table
         table = Table(pdf_data, colWidths=[200, 100, 100])
@@ -244,14 +592,26 @@ class DataProcessorGUI:
         table.drawOn(c, 50, height - 150 - table_height)
         
         # Attempt to embed the plot
-        plot_file = base_name + "_plot.png"
         y_position = height - 160 - table_height
-        if os.path.exists(plot_file):
+        if plot_png is not None:
             # Insert the plot image below the table
-            c.drawImage(plot_file, 50, y_position - 300, width=400, height=300, preserveAspectRatio=True)
+            c.drawImage(ImageReader(io.BytesIO(plot_png)), 50, y_position - 300, width=400, height=300, preserveAspectRatio=True)
         
         # Save PDF
         c.save()
+    
+    def clear_cache(self):
+        """
+        Deletes the cached per-file results so the next run re-reads every CSV.
+        """
+        try:
+            shutil.rmtree(CACHE_DIR)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            messagebox.showerror("Error", f"An error occurred while clearing the cache:\n{e}")
+            return
+        messagebox.showinfo("Success", "Cache cleared.")
 
 def main():
     root = tk.Tk()
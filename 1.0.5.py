@@ -1,6 +1,8 @@
 import pandas as pd
-import matplotlib.pyplot as plt
+from pandas.api.types import union_categoricals
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from reportlab.lib.pagesizes import letter
@@ -8,7 +10,205 @@ from reportlab.pdfgen import canvas
 from reportlab.lib import colors
 from reportlab.platypus import Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.lib.utils import ImageReader
 import os
+import io
+import mmap
+import hashlib
+import numpy as np
+import threading
+import queue
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# First columns of the header row that starts each file's data table
+HEADER_PREFIX = b"Time,Metric,Value,Measurement"
+
+def find_header_row(file_path):
+    """
+    Returns the line number of the header row in file_path, or None if the
+    file doesn't contain one.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None  # mmap can't map an empty file
+        
+        # Search the mapped file in one C-level scan instead of decoding it line by line
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = mm.find(HEADER_PREFIX)
+            while pos != -1:
+                # Only a line that starts with the prefix (after optional whitespace)
+                # is the header; a preamble line may mention it further in
+                line_start = mm.rfind(b"\n", 0, pos) + 1
+                if not mm[line_start:pos].strip():
+                    return mm[:line_start].count(b"\n")
+                pos = mm.find(HEADER_PREFIX, pos + 1)
+            return None
+
+# Optional JIT for the grouped min/max; pandas' groupby is used without numba
+try:
+    from numba import njit, types
+except ImportError:
+    njit = None
+
+# Optional Arrow CSV reader and compute kernels; pandas' C parser is used without them
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+# pandas' multithreaded pyarrow CSV engine when pyarrow is installed, else the C parser
+CSV_ENGINE = "pyarrow" if pa is not None else "c"
+
+# Rows inserted into the Treeview per idle callback
+TREE_INSERT_BATCH = 500
+
+# The only columns the report uses
+LOSS_COLUMNS = ["Measurement", "Percentage Loss"]
+
+def read_losses(file_path, header_row):
+    """
+    Reads the Measurement and Percentage Loss columns of a CSV whose header
+    row is line header_row. The other columns are skipped while parsing.
+    """
+    if CSV_ENGINE == "pyarrow":
+        # The pyarrow engine skips the lines above the header through header=
+        df = pd.read_csv(file_path, header=header_row, usecols=LOSS_COLUMNS, engine="pyarrow")
+    else:
+        df = pd.read_csv(
+            file_path,
+            skiprows=range(0, header_row),
+            header=0,
+            usecols=LOSS_COLUMNS,
+            encoding="utf-8"
+        )
+    
+    # Group on integer category codes rather than hashing the label strings
+    df['Measurement'] = df['Measurement'].astype('category')
+    return df
+
+def arrow_group(file_path, header_row):
+    """
+    Reads and groups a CSV entirely in Arrow, like read_losses + clean_and_group.
+    Returns (grouped, dropped), or None when Arrow can't parse the file or its
+    Percentage Loss column holds text, which pandas then coerces.
+    """
+    try:
+        tbl = pacsv.read_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(skip_rows=header_row),
+            convert_options=pacsv.ConvertOptions(include_columns=LOSS_COLUMNS, strings_can_be_null=True)
+        )
+    except (pa.ArrowInvalid, KeyError):
+        return None  # let pandas report the problem
+    
+    losses = tbl.column('Percentage Loss')
+    if not (pa.types.is_floating(losses.type) or pa.types.is_integer(losses.type) or pa.types.is_null(losses.type)):
+        return None
+    tbl = tbl.set_column(1, 'Percentage Loss', losses.cast(pa.float64()))
+    
+    # Rows without a loss value are dropped (and counted), rows without a label are left out
+    valid = pc.is_valid(tbl.column('Percentage Loss'))
+    dropped = len(tbl) - pc.sum(valid).as_py() if len(tbl) else 0
+    tbl = tbl.filter(pc.and_(valid, pc.is_valid(tbl.column('Measurement'))))
+    
+    agg = tbl.group_by('Measurement').aggregate([('Percentage Loss', 'min'), ('Percentage Loss', 'max')])
+    grouped = agg.sort_by('Measurement').to_pandas()
+    grouped = grouped.rename(columns={'Percentage Loss_min': 'Min Loss', 'Percentage Loss_max': 'Max Loss'})
+    grouped['Measurement'] = grouped['Measurement'].astype('category')
+    return grouped[['Measurement', 'Min Loss', 'Max Loss']], dropped
+
+if njit is not None:
+    # The explicit signature compiles (or loads from cache) at import, not on the first file.
+    # vals is typed read-only since pandas may hand out a read-only view; writable arrays match too
+    _MINMAX_SIGNATURE = types.Tuple((types.float64[:], types.float64[:], types.int64[:], types.int64))(
+        types.int64[:], types.Array(types.float64, 1, 'A', readonly=True), types.int64
+    )
+    
+    @njit(_MINMAX_SIGNATURE, cache=True)
+    def _minmax(codes, vals, n):
+        # Single sweep over the rows: rows without a loss value are only counted,
+        # the rest update a running min/max and row count per code
+        mn = np.full(n, np.inf)
+        mx = np.full(n, -np.inf)
+        counts = np.zeros(n, dtype=np.int64)
+        dropped = 0
+        for i in range(codes.size):
+            v = vals[i]
+            if np.isnan(v):
+                dropped += 1
+                continue
+            c = codes[i]
+            if c < 0:
+                continue  # missing Measurement, which groupby leaves out too
+            counts[c] += 1
+            if v < mn[c]:
+                mn[c] = v
+            if v > mx[c]:
+                mx[c] = v
+        return mn, mx, counts, dropped
+else:
+    _minmax = None
+
+def clean_and_group(df):
+    """
+    Cleans Percentage Loss and groups it by Measurement in one pass.
+    Returns (grouped, dropped): Measurement / Min Loss / Max Loss sorted by
+    Measurement, and the number of rows whose Percentage Loss wasn't a number.
+    """
+    losses = df['Percentage Loss']
+    if not pd.api.types.is_numeric_dtype(losses):
+        losses = pd.to_numeric(losses, errors='coerce')
+    
+    if _minmax is None:
+        # One validity mask filters just the two columns needed, instead of
+        # assigning the coerced column into a frame copy and then dropna'ing it
+        valid = losses.notna().to_numpy()
+        dropped = len(valid) - int(valid.sum())
+        grouped = losses[valid].groupby(df['Measurement'][valid], observed=True).agg(['min', 'max']).reset_index()
+        return grouped.rename(columns={'min': 'Min Loss', 'max': 'Max Loss'}), dropped
+    
+    # Factorize the labels once and reduce on the integer codes (missing labels get -1);
+    # no cleaned copy of the frame is built
+    codes, uniques = pd.factorize(df['Measurement'], sort=True)
+    vals = losses.to_numpy(dtype=np.float64, na_value=np.nan)
+    mn, mx, counts, dropped = _minmax(codes, vals, len(uniques))
+    
+    # Measurements whose every value was dropped don't appear, as with dropna + groupby
+    keep = counts > 0
+    grouped = pd.DataFrame({'Measurement': uniques[keep], 'Min Loss': mn[keep], 'Max Loss': mx[keep]})
+    return grouped, int(dropped)
+
+def file_stamp(file_path):
+    """
+    (modification time, size) of file_path; editing the file changes it.
+    """
+    st = os.stat(file_path)
+    return (st.st_mtime_ns, st.st_size)
+
+def _process_one(file_path):
+    """
+    Header detection, read, clean and group one CSV file.
+    Returns its grouped rows tagged with the file name, or None if the
+    header row wasn't found. Runs in a worker process.
+    """
+    # Locate the custom header row
+    header_row = find_header_row(file_path)
+    if header_row is None:
+        return None
+    
+    # Group in Arrow when the losses parse as numbers; otherwise read the
+    # CSV from that header with pandas, clean the data and group by Measurement
+    result = arrow_group(file_path, header_row) if pa is not None else None
+    if result is None:
+        result = clean_and_group(read_losses(file_path, header_row))
+    grouped_df, _ = result
+    
+    # Tag each row with the file name
+    grouped_df['File Source'] = os.path.basename(file_path)
+    return grouped_df
 
 class DataProcessorGUI:
     def __init__(self, master):
@@ -22,8 +222,23 @@ class DataProcessorGUI:
         # Will hold the combined results of all processed files
         self.combined_data = pd.DataFrame()
         
-        # Path where the combined plot is saved (for PDF)
-        self.plot_path = "plot.png"
+        # Grouped result of each processed file: {path: (file_stamp, grouped_df)}
+        self._results_cache = {}
+        
+        # Pending batch of Treeview inserts
+        self._insert_job = None
+        
+        # Hash of the data currently plotted
+        self._last_plot_hash = None
+        
+        # Bar containers per axes, {ax: (min_bars, max_bars)}, updated in place on reruns
+        self._bars = {}
+        
+        # Messages from the processing thread, read on the Tk thread by _drain_queue
+        self._queue = queue.Queue()
+        
+        # The combined plot encoded as PNG, kept in memory for the PDF
+        self.plot_png = None
         
         # Create all GUI widgets
         self.create_widgets()
@@ -39,10 +254,10 @@ class DataProcessorGUI:
         self.lbl_file = tk.Label(frame_file, text="No files selected", width=80, anchor="w")
         self.lbl_file.pack(side=tk.LEFT, padx=5)
         
-        # Button to process data
-        btn_process = tk.Button(self.master, text="Process Data", command=self.process_data,
-                                bg="green", fg="white")
-        btn_process.pack(pady=10)
+        # Button to process data (disabled while a run is in progress)
+        self.btn_process = tk.Button(self.master, text="Process Data", command=self.process_data,
+                                     bg="green", fg="white")
+        self.btn_process.pack(pady=10)
         
         # Button to save combined CSV
         btn_csv = tk.Button(self.master, text="Save CSV", command=self.save_csv,
@@ -81,11 +296,19 @@ class DataProcessorGUI:
         frame_plot = tk.Frame(self.master)
         frame_plot.pack(pady=10)
         
-        self.fig, self.ax = plt.subplots(figsize=(8,4))
+        # A plain Figure drawn only by the Tk canvas below; going through pyplot
+        # would also register it with pyplot's own backend and figure manager
+        self.fig = Figure(figsize=(8,4))
+        self.ax = self.fig.add_subplot(111)
         self.canvas = FigureCanvasTkAgg(self.fig, master=frame_plot)
         self.canvas.draw()
         self.canvas.get_tk_widget().pack()
         
+        # Offscreen copy of the chart, rendered with Agg for the PDF image
+        self._pdf_fig = Figure(figsize=(8,4))
+        self._pdf_canvas = FigureCanvasAgg(self._pdf_fig)
+        self._pdf_ax = self._pdf_fig.add_subplot(111)
+        
         # Button to generate PDF
         btn_report = tk.Button(
             self.master,
@@ -116,65 +339,133 @@ class DataProcessorGUI:
         # Clear any old combined data
         self.combined_data = pd.DataFrame()
         
+        # Process the files in a background thread so the window stays responsive;
+        # it only reports through the queue, which is polled from the Tk thread
+        self.btn_process.config(state=tk.DISABLED)
+        csv_files = list(self.csv_files)
+        self.lbl_file.config(text=f"Processing 0/{len(csv_files)} file(s)...")
+        threading.Thread(target=self._process_files, args=(csv_files,), daemon=True).start()
+        self.master.after(50, self._drain_queue)
+    
+    def _process_files(self, csv_files):
+        """
+        Runs off the Tk thread: processes every CSV in a pool of worker processes,
+        putting progress and then the results on self._queue. Never touches Tk.
+        """
+        try:
+            # Reuse the results of files that haven't changed since they were last processed
+            stamps = [file_stamp(file_path) for file_path in csv_files]
+            results = [None] * len(csv_files)
+            pending = []
+            for i, (file_path, stamp) in enumerate(zip(csv_files, stamps)):
+                cached = self._results_cache.get(file_path)
+                if cached is not None and cached[0] == stamp:
+                    results[i] = cached[1]
+                else:
+                    pending.append(i)
+            
+            done = len(csv_files) - len(pending)
+            if pending:
+                self._queue.put(("progress", done, len(csv_files)))
+                with ProcessPoolExecutor(max_workers=min(len(pending), os.cpu_count() or 1)) as executor:
+                    for i, grouped_df in zip(pending, executor.map(_process_one, [csv_files[i] for i in pending])):
+                        results[i] = grouped_df
+                        if grouped_df is not None:
+                            self._results_cache[csv_files[i]] = (stamps[i], grouped_df)
+                        done += 1
+                        self._queue.put(("progress", done, len(csv_files)))
+        except Exception as e:
+            self._queue.put(("failed", e))
+            return
+        self._queue.put(("done", csv_files, results))
+    
+    def _drain_queue(self):
+        """
+        Applies the processing thread's messages on the Tk thread, polling
+        again until the results (or the error) have arrived.
+        """
+        while True:
+            try:
+                kind, *args = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            if kind == "progress":
+                done, total = args
+                self.lbl_file.config(text=f"Processing {done}/{total} file(s)...")
+                continue
+            
+            self.lbl_file.config(text=f"{len(self.csv_files)} file(s) selected")
+            if kind == "done":
+                self._show_results(*args)
+            else:
+                self._processing_failed(*args)
+            return
+        
+        self.master.after(50, self._drain_queue)
+    
+    def _processing_failed(self, error):
+        self.btn_process.config(state=tk.NORMAL)
+        messagebox.showerror("Error", f"An error occurred while processing:\n{error}")
+    
+    def _show_results(self, csv_files, results):
+        """
+        Combines the per-file results and updates the table and plot (on the Tk thread).
+        """
+        self.btn_process.config(state=tk.NORMAL)
+        
         try:
             all_grouped_frames = []
             
-            # Process each CSV file
-            for file_path in self.csv_files:
-                # Locate the custom header row
-                header_row = None
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    for idx, line in enumerate(f):
-                        if line.strip().startswith("Time,Metric,Value,Measurement"):
-                            header_row = idx
-                            break
-                
-                if header_row is None:
+            for file_path, grouped_df in zip(csv_files, results):
+                if grouped_df is None:
                     messagebox.showwarning(
                         "Warning",
                         f"Header row not found in {os.path.basename(file_path)}. Skipping."
                     )
                     continue
-
-                # Read the CSV from that header
-                df = pd.read_csv(
-                    file_path,
-                    skiprows=range(0, header_row),
-                    header=0,
-                    encoding="utf-8"
-                )
-                
-                # Clean data
-                df['Percentage Loss'] = pd.to_numeric(df['Percentage Loss'], errors='coerce')
-                df.dropna(subset=['Percentage Loss'], inplace=True)
-                
-                # Group by Measurement
-                grouped_df = df.groupby("Measurement")["Percentage Loss"].agg(['min', 'max']).reset_index()
-                grouped_df.rename(columns={'min': 'Min Loss', 'max': 'Max Loss'}, inplace=True)
-                
-                # Tag each row with the file name
-                grouped_df['File Source'] = os.path.basename(file_path)
                 
                 # Add to our list
                 all_grouped_frames.append(grouped_df)
             
             # If we have at least one valid file, combine them
-            if all_grouped_frames:
-                self.combined_data = pd.concat(all_grouped_frames, ignore_index=True)
-            else:
+            if not all_grouped_frames:
                 messagebox.showerror("Error", "No valid data found in the selected files.")
                 return
             
+            # Give every frame the same categorical dtypes (the union of all labels and
+            # file names), so concat joins the integer codes instead of falling back to
+            # object columns. New frames are built: the cached results stay untouched
+            measurement_dtype = pd.CategoricalDtype(union_categoricals(
+                [grouped_df['Measurement'].astype('category') for grouped_df in all_grouped_frames],
+                sort_categories=True
+            ).categories)
+            source_dtype = pd.CategoricalDtype(pd.unique(
+                np.concatenate([grouped_df['File Source'].unique() for grouped_df in all_grouped_frames])
+            ))
+            self.combined_data = pd.concat(
+                [
+                    grouped_df.astype({'Measurement': measurement_dtype, 'File Source': source_dtype})
+                    for grouped_df in all_grouped_frames
+                ],
+                ignore_index=True
+            )
+            
             # Update the Treeview with combined data
             self.update_table(self.combined_data)
             
             # Generate a single combined plot (optional)
-            # This aggregates min/max across all files per Measurement name
-            aggregated_for_plot = (
-                self.combined_data.groupby("Measurement")
-                                  .agg({"Min Loss": "min", "Max Loss": "max"})
-                                  .reset_index()
-            )
+            # This aggregates min/max across all files per Measurement name: the rows are
+            # stably sorted by category code and each run of equal codes is reduced at once
+            codes = self.combined_data['Measurement'].cat.codes.to_numpy()
+            order = np.argsort(codes, kind='stable')
+            sorted_codes = codes[order]
+            starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+            aggregated_for_plot = pd.DataFrame({
+                'Measurement': self.combined_data['Measurement'].cat.categories[sorted_codes[starts]],
+                'Min Loss': np.minimum.reduceat(self.combined_data['Min Loss'].to_numpy()[order], starts),
+                'Max Loss': np.maximum.reduceat(self.combined_data['Max Loss'].to_numpy()[order], starts),
+            })
             self.generate_plot(aggregated_for_plot)
             
             messagebox.showinfo("Success", "All files processed successfully.")
@@ -187,48 +478,97 @@ class DataProcessorGUI:
         Refreshes the Treeview with the new DataFrame rows.
         """
         # Clear existing rows
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Insert new rows
-        for _, row in data.iterrows():
-            self.tree.insert(
-                "",
-                tk.END,
-                values=(
-                    row['File Source'],
-                    row['Measurement'],
-                    row['Min Loss'],
-                    row['Max Loss']
-                )
-            )
+        self.clear_table()
+        
+        # Insert new rows as plain tuples (iterrows would box each row into a Series)
+        display_cols = ['File Source', 'Measurement', 'Min Loss', 'Max Loss']
+        self.insert_rows(list(data[display_cols].itertuples(index=False, name=None)))
+    
+    def insert_rows(self, rows, start=0):
+        """
+        Inserts rows into the Treeview a batch at a time, handing control back
+        to Tk between batches so a long result doesn't stall the window.
+        """
+        end = start + TREE_INSERT_BATCH
+        for values in rows[start:end]:
+            self.tree.insert("", tk.END, values=values)
+        
+        if end < len(rows):
+            self._insert_job = self.tree.after_idle(self.insert_rows, rows, end)
+        else:
+            self._insert_job = None
+    
+    def clear_table(self):
+        """
+        Removes every row, cancelling any batch insert_rows still has queued.
+        """
+        if self._insert_job is not None:
+            self.tree.after_cancel(self._insert_job)
+            self._insert_job = None
+        # One delete call for all rows instead of one Tcl round-trip per row
+        self.tree.delete(*self.tree.get_children())
     
     def generate_plot(self, data):
         """
         Creates a bar chart for the combined data (aggregated min/max per Measurement).
         Saves a plot image for PDF use.
+        Skipped when the data is the same as the last plot's.
+        """
+        # Re-running with the same files gives the same aggregate: keep the existing plot
+        plot_hash = hashlib.blake2b(
+            pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes(), digest_size=16
+        ).hexdigest()
+        if plot_hash == self._last_plot_hash and self.plot_png is not None:
+            return
+        
+        # On-screen chart
+        # Only a rebuilt chart needs a new layout; updated bars keep theirs
+        if self._draw_bars(self.ax, data):
+            self.fig.tight_layout()
+        self.canvas.draw_idle()
+        
+        # Encode plot image for PDF from the offscreen figure, leaving the Tk canvas alone
+        self._draw_bars(self._pdf_ax, data)
+        self._pdf_fig.tight_layout()
+        buf = io.BytesIO()
+        self._pdf_canvas.print_png(buf)
+        self.plot_png = buf.getvalue()
+        self._last_plot_hash = plot_hash
+    
+    def _draw_bars(self, ax, data):
+        """
+        Draws the min/max bar chart of data on ax, replacing its previous contents.
+        When ax already shows as many bars, only their heights and labels change.
+        Returns True if the chart was rebuilt.
         """
-        self.ax.clear()
+        bars = self._bars.get(ax)
+        if bars is not None and len(bars[0]) == len(data):
+            for rect, h in zip(bars[0], data['Min Loss']):
+                rect.set_height(h)
+            for rect, h in zip(bars[1], data['Max Loss']):
+                rect.set_height(h)
+            ax.set_xticklabels(data['Measurement'], rotation=45, ha='right')
+            ax.relim()
+            ax.autoscale_view()
+            return False
+        
+        ax.clear()
         
-        import numpy as np
         x = np.arange(len(data))
         width = 0.35
         
-        self.ax.bar(x - width/2, data['Min Loss'], width, label='Min Loss')
-        self.ax.bar(x + width/2, data['Max Loss'], width, label='Max Loss')
-        
-        self.ax.set_xlabel('Measurement')
-        self.ax.set_ylabel('Percentage Loss')
-        self.ax.set_title('Minimum and Maximum Percentage Loss (Combined)')
-        self.ax.set_xticks(x)
-        self.ax.set_xticklabels(data['Measurement'], rotation=45, ha='right')
-        self.ax.legend()
-        
-        self.fig.tight_layout()
-        self.canvas.draw()
+        self._bars[ax] = (
+            ax.bar(x - width/2, data['Min Loss'], width, label='Min Loss'),
+            ax.bar(x + width/2, data['Max Loss'], width, label='Max Loss'),
+        )
         
-        # Save plot image for PDF
-        self.fig.savefig(self.plot_path)
+        ax.set_xlabel('Measurement')
+        ax.set_ylabel('Percentage Loss')
+        ax.set_title('Minimum and Maximum Percentage Loss (Combined)')
+        ax.set_xticks(x)
+        ax.set_xticklabels(data['Measurement'], rotation=45, ha='right')
+        ax.legend()
+        return True
     
     def generate_report(self):
         """
@@ -262,7 +602,16 @@ class DataProcessorGUI:
             
             # Prepare data for table
             display_cols = ["File Source", "Measurement", "Min Loss", "Max Loss"]
-            pdf_data = [display_cols] + self.combined_data[display_cols].values.tolist()
+            # The loss columns are formatted to strings in one vectorized call each
+            # instead of boxing every float into the row lists
+            src = self.combined_data
+            body = np.column_stack([
+                src['File Source'].to_numpy(object),
+                src['Measurement'].to_numpy(object),
+                np.char.mod('%.4f', src['Min Loss'].to_numpy(np.float64)),
+                np.char.mod('%.4f', src['Max Loss'].to_numpy(np.float64)),
+            ]).tolist()
+            pdf_data = [display_cols] + body
             
             table = Table(pdf_data, colWidths=[120, 150, 80, 80])
             table.setStyle(TableStyle([
@@ -281,8 +630,8 @@ class DataProcessorGUI:
             
             # Place the plot below the table if available
             y_position = height - 160 - table_height
-            if os.path.exists(self.plot_path):
-                c.drawImage(self.plot_path, 50, y_position - 300, width=500, height=300, preserveAspectRatio=True)
+            if self.plot_png is not None:
+                c.drawImage(ImageReader(io.BytesIO(self.plot_png)), 50, y_position - 300, width=500, height=300, preserveAspectRatio=True)
             
             c.save()
             messagebox.showinfo("Success", f"Report saved successfully at:\n{report_path}")
@@ -318,4 +667,5 @@ def main():
     root.mainloop()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Needed for the worker processes in frozen builds
     main()
@@ -1,6 +1,7 @@
 import pandas as pd
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk, simpledialog
 from reportlab.lib.pagesizes import letter
@@ -10,8 +11,133 @@ from reportlab.platypus import Table, TableStyle, Image, Paragraph, Spacer, Simp
 from reportlab.lib.styles import getSampleStyleSheet
 import os
 import numpy as np
-import tempfile
-import atexit
+import io
+from openpyxl import load_workbook
+import mmap
+import hashlib
+import importlib.util
+
+# First columns of the processed data header row in CSV files
+HEADER_PREFIX = b"Time,Metric,Value,Measurement"
+
+def find_csv_header_row(file_path):
+    """
+    Returns the line number of the processed data header in a CSV file,
+    or None if it isn't there.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None  # mmap can't map an empty file
+        
+        # Memory-map the file and find the header with one bytes search;
+        # the lines before it are counted without decoding them
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = mm.find(HEADER_PREFIX)
+            while pos != -1:
+                # Only a line that starts with the prefix (after optional whitespace)
+                # is the header; a preamble line may mention it further in
+                line_start = mm.rfind(b"\n", 0, pos) + 1
+                if not mm[line_start:pos].strip():
+                    return mm[:line_start].count(b"\n")
+                pos = mm.find(HEADER_PREFIX, pos + 1)
+            return None
+
+# Optional JIT for the grouped min/max; pandas' groupby is used without numba
+try:
+    from numba import njit, types
+except ImportError:
+    njit = None
+
+# Parse CSVs with pandas' multithreaded pyarrow engine when pyarrow is installed
+CSV_ENGINE = "pyarrow" if importlib.util.find_spec("pyarrow") else "c"
+
+if njit is not None:
+    # The explicit signature compiles (or loads from cache) at import, not on the first file.
+    # vals is typed read-only since pandas may hand out a read-only view; writable arrays match too
+    _MINMAX_SIGNATURE = types.Tuple((types.float64[:], types.float64[:], types.int64[:], types.int64))(
+        types.int64[:], types.Array(types.float64, 1, 'A', readonly=True), types.int64
+    )
+    
+    @njit(_MINMAX_SIGNATURE, cache=True)
+    def _minmax(codes, vals, n):
+        # Single sweep over the rows: rows without a loss value are only counted,
+        # the rest update a running min/max and row count per code
+        mn = np.full(n, np.inf)
+        mx = np.full(n, -np.inf)
+        counts = np.zeros(n, dtype=np.int64)
+        dropped = 0
+        for i in range(codes.size):
+            v = vals[i]
+            if np.isnan(v):
+                dropped += 1
+                continue
+            c = codes[i]
+            if c < 0:
+                continue  # missing Measurement, which groupby leaves out too
+            counts[c] += 1
+            if v < mn[c]:
+                mn[c] = v
+            if v > mx[c]:
+                mx[c] = v
+        return mn, mx, counts, dropped
+else:
+    _minmax = None
+
+def clean_and_group(df):
+    """
+    Cleans Percentage Loss and groups it by Measurement in one pass.
+    Returns (grouped, dropped): Measurement / Min Loss / Max Loss sorted by
+    Measurement, and the number of rows whose Percentage Loss wasn't a number.
+    """
+    losses = df['Percentage Loss']
+    if not pd.api.types.is_numeric_dtype(losses):
+        losses = pd.to_numeric(losses, errors='coerce')
+    
+    if _minmax is None:
+        # One validity mask filters just the two columns needed, instead of
+        # assigning the coerced column into a frame copy and then dropna'ing it
+        valid = losses.notna().to_numpy()
+        dropped = len(valid) - int(valid.sum())
+        grouped = losses[valid].groupby(df['Measurement'][valid], observed=True).agg(['min', 'max']).reset_index()
+        return grouped.rename(columns={'min': 'Min Loss', 'max': 'Max Loss'}), dropped
+    
+    # Factorize the labels once and reduce on the integer codes (missing labels get -1);
+    # no cleaned copy of the frame is built
+    codes, uniques = pd.factorize(df['Measurement'], sort=True)
+    vals = losses.to_numpy(dtype=np.float64, na_value=np.nan)
+    mn, mx, counts, dropped = _minmax(codes, vals, len(uniques))
+    
+    # Measurements whose every value was dropped don't appear, as with dropna + groupby
+    keep = counts > 0
+    grouped = pd.DataFrame({'Measurement': uniques[keep], 'Min Loss': mn[keep], 'Max Loss': mx[keep]})
+    return grouped, int(dropped)
+
+# Rows inserted into the Treeview per idle callback
+TREE_INSERT_BATCH = 500
+
+def find_xlsx_header(file_path):
+    """
+    Finds the header row (first cell starting with "Time") of an .xlsx workbook by
+    streaming its rows with openpyxl, without loading any sheet into a DataFrame.
+    Returns (sheet_names, sheet, row_index); sheet and row_index are None if no
+    sheet has the header.
+    """
+    wb = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        for sheet in wb.sheetnames:
+            for idx, row in enumerate(wb[sheet].iter_rows(values_only=True)):
+                if row and isinstance(row[0], str) and row[0].startswith("Time"):
+                    return wb.sheetnames, sheet, idx
+        return wb.sheetnames, None, None
+    finally:
+        wb.close()
+
+def file_stamp(file_path):
+    """
+    (modification time, size) of file_path; editing the file changes it.
+    """
+    st = os.stat(file_path)
+    return (st.st_mtime_ns, st.st_size)
 
 class DataProcessorGUI:
     def __init__(self, master):
@@ -22,7 +148,11 @@ class DataProcessorGUI:
         # Initialize variables
         self.data_file = ""
         self.grouped_data = pd.DataFrame()
-        self.plot_path = "plot.png"
+        self.plot_png = None  # Encoded plot for the PDF, kept in memory
+        self._results_cache = {}  # {path: (file_stamp, (grouped, dropped_rows))}
+        self._insert_job = None  # Pending batch of Treeview inserts
+        self._last_plot_hash = None  # Hash of the data behind plot_png
+        self._bars = {}  # {ax: (min_bars, max_bars)}, updated in place on reruns
         
         # Create GUI components
         self.create_widgets()
@@ -66,11 +196,19 @@ class DataProcessorGUI:
         frame_plot = tk.Frame(self.master)
         frame_plot.pack(pady=10)
         
-        self.fig, self.ax = plt.subplots(figsize=(8,4))
+        # A plain Figure drawn only by the Tk canvas below; going through pyplot
+        # would also register it with pyplot's own backend and figure manager
+        self.fig = Figure(figsize=(8,4))
+        self.ax = self.fig.add_subplot(111)
         self.canvas = FigureCanvasTkAgg(self.fig, master=frame_plot)
         self.canvas.draw()
         self.canvas.get_tk_widget().pack()
         
+        # Offscreen copy of the chart, rendered with Agg for the PDF image
+        self._pdf_fig = Figure(figsize=(8,4))
+        self._pdf_canvas = FigureCanvasAgg(self._pdf_fig)
+        self._pdf_ax = self._pdf_fig.add_subplot(111)
+        
         # Generate Report Button
         btn_report = tk.Button(self.master, text="Generate PDF Report", command=self.generate_report, bg="blue", fg="white")
         btn_report.pack(pady=10)
@@ -92,33 +230,33 @@ class DataProcessorGUI:
         try:
             file_extension = os.path.splitext(self.data_file)[1].lower()
             
-            # Determine file type and read accordingly
-            if file_extension == '.csv':
-                # Detect header row for CSV
-                df = self.read_csv_with_header_detection(self.data_file)
-            elif file_extension in ['.xlsx', '.xls']:
-                # Detect header row for Excel
-                df = self.read_excel_with_header_detection(self.data_file)
+            # Reuse the previous result while the file is unchanged
+            stamp = file_stamp(self.data_file)
+            cached = self._results_cache.get(self.data_file)
+            if cached is not None and cached[0] == stamp:
+                grouped, dropped_rows = cached[1]
             else:
-                messagebox.showerror("Error", "Unsupported file type selected.")
-                return
+                # Determine file type and read accordingly
+                if file_extension == '.csv':
+                    # Detect header row for CSV
+                    df = self.read_csv_with_header_detection(self.data_file)
+                elif file_extension in ['.xlsx', '.xls']:
+                    # Detect header row for Excel
+                    df = self.read_excel_with_header_detection(self.data_file)
+                else:
+                    messagebox.showerror("Error", "Unsupported file type selected.")
+                    return
 
-            if df is None:
-                return  # Error message already shown in the read functions
+                if df is None:
+                    return  # Error message already shown in the read functions
 
-            # Data Cleaning
-            df['Percentage Loss'] = pd.to_numeric(df['Percentage Loss'], errors='coerce')
-            initial_row_count = df.shape[0]
-            df = df.dropna(subset=['Percentage Loss'])
-            cleaned_row_count = df.shape[0]
-            dropped_rows = initial_row_count - cleaned_row_count
+                # Data Cleaning and Grouping
+                grouped, dropped_rows = clean_and_group(df)
+                self._results_cache[self.data_file] = (stamp, (grouped, dropped_rows))
 
             if dropped_rows > 0:
                 messagebox.showwarning("Warning", f"Dropped {dropped_rows} rows due to invalid 'Percentage Loss' values.")
 
-            # Grouping
-            grouped = df.groupby("Measurement")["Percentage Loss"].agg(['min', 'max']).reset_index()
-            grouped.rename(columns={'min': 'Min Loss', 'max': 'Max Loss'}, inplace=True)
             self.grouped_data = grouped
 
             # Update Treeview
@@ -135,29 +273,34 @@ class DataProcessorGUI:
     def read_csv_with_header_detection(self, file_path):
         try:
             # Detect header row by searching for the processed data header
-            with open(file_path, 'r', encoding='utf-8') as f:
-                for idx, line in enumerate(f):
-                    if line.strip().startswith("Time,Metric,Value,Measurement"):
-                        header_row = idx
-                        break
-                else:
-                    messagebox.showerror("Error", "Header row not found in the CSV file.")
-                    return None
-
-            # Read the CSV, skipping metadata rows
-            df = pd.read_csv(
-                file_path,
-                skiprows=range(0, header_row),
-                header=0,
-                encoding="utf-8"
-            )
+            header_row = find_csv_header_row(file_path)
+            if header_row is None:
+                messagebox.showerror("Error", "Header row not found in the CSV file.")
+                return None
 
-            # Validate required columns
+            # Validate required columns against the header row alone
             required_columns = ["Measurement", "Percentage Loss"]
-            if not all(col in df.columns for col in required_columns):
+            columns = pd.read_csv(file_path, skiprows=range(0, header_row), header=0, nrows=0, encoding="utf-8").columns
+            if not all(col in columns for col in required_columns):
                 messagebox.showerror("Error", f"CSV file must contain the following columns: {', '.join(required_columns)}")
                 return None
 
+            # Read only the required columns, skipping metadata rows
+            if CSV_ENGINE == "pyarrow":
+                # The pyarrow engine skips the lines above the header through header=
+                df = pd.read_csv(file_path, header=header_row, usecols=required_columns, engine="pyarrow")
+            else:
+                df = pd.read_csv(
+                    file_path,
+                    skiprows=range(0, header_row),
+                    header=0,
+                    usecols=required_columns,
+                    encoding="utf-8"
+                )
+
+            # Categorical labels let the grouping work on integer codes
+            df['Measurement'] = df['Measurement'].astype('category')
+
             return df
 
         except pd.errors.EmptyDataError:
@@ -172,28 +315,30 @@ class DataProcessorGUI:
 
     def read_excel_with_header_detection(self, file_path):
         try:
-            # Read the entire Excel file to find the header row
-            xls = pd.ExcelFile(file_path)
-            sheet_names = xls.sheet_names  # List of sheet names
-            df = None
-            selected_sheet = None
-
-            # Search for header in all sheets
-            for sheet in sheet_names:
-                temp_df = pd.read_excel(file_path, sheet_name=sheet, header=None)
-                for idx, row in temp_df.iterrows():
-                    if isinstance(row[0], str) and row[0].startswith("Time"):
-                        # Assume this is the header row
-                        df = pd.read_excel(file_path, sheet_name=sheet, skiprows=range(0, idx), header=0)
-                        selected_sheet = sheet
+            # Find the header row: stream .xlsx rows with openpyxl; openpyxl can't
+            # read legacy .xls workbooks, so those are still scanned with pandas
+            if os.path.splitext(file_path)[1].lower() == '.xlsx':
+                sheet_names, selected_sheet, idx = find_xlsx_header(file_path)
+            else:
+                xls = pd.ExcelFile(file_path)
+                sheet_names = xls.sheet_names  # List of sheet names
+                selected_sheet = idx = None
+                for sheet in sheet_names:
+                    temp_df = xls.parse(sheet_name=sheet, header=None)
+                    if temp_df.empty:
+                        continue
+                    matches = temp_df[0].map(lambda v: isinstance(v, str) and v.startswith("Time"))
+                    if matches.any():
+                        selected_sheet, idx = sheet, int(matches.to_numpy().argmax())
                         break
-                if df is not None:
-                    break
 
-            if df is None:
+            if selected_sheet is None:
                 messagebox.showerror("Error", "Header row not found in the Excel file.")
                 return None
 
+            # Parse the sheet once, from the header row
+            df = pd.read_excel(file_path, sheet_name=selected_sheet, skiprows=range(0, idx), header=0)
+
             # If multiple sheets have the header, ask the user to choose
             if sheet_names.count(selected_sheet) > 1:
                 selected_sheet = simpledialog.askstring("Select Sheet", f"Multiple sheets found. Enter the sheet name to use (Available sheets: {', '.join(sheet_names)}):")
@@ -222,43 +367,91 @@ class DataProcessorGUI:
 
     def update_table(self, data):
         # Clear existing data
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.clear_table()
         
-        # Insert new data
-        for _, row in data.iterrows():
-            self.tree.insert("", tk.END, values=(row['Measurement'], row['Min Loss'], row['Max Loss']))
+        # Insert new data as plain tuples rather than one Series per row
+        self.insert_rows(list(data[['Measurement', 'Min Loss', 'Max Loss']].itertuples(index=False, name=None)))
+    
+    def insert_rows(self, rows, start=0):
+        """
+        Inserts rows into the Treeview a batch at a time, handing control back
+        to Tk between batches so a long result doesn't stall the window.
+        """
+        end = start + TREE_INSERT_BATCH
+        for values in rows[start:end]:
+            self.tree.insert("", tk.END, values=values)
+        
+        if end < len(rows):
+            self._insert_job = self.tree.after_idle(self.insert_rows, rows, end)
+        else:
+            self._insert_job = None
+    
+    def clear_table(self):
+        """
+        Removes every row, cancelling any batch insert_rows still has queued.
+        """
+        if self._insert_job is not None:
+            self.tree.after_cancel(self._insert_job)
+            self._insert_job = None
+        # One delete call for all rows instead of one Tcl round-trip per row
+        self.tree.delete(*self.tree.get_children())
     
     def generate_plot(self, data):
-        self.ax.clear()
+        # Same data as the current plot (e.g. the same file processed again): keep it
+        plot_hash = hashlib.blake2b(
+            pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes(), digest_size=16
+        ).hexdigest()
+        if plot_hash == self._last_plot_hash and self.plot_png is not None:
+            return
+        
+        # Draw the chart on screen
+        # Only a rebuilt chart needs a new layout; updated bars keep theirs
+        if self._draw_bars(self.ax, data):
+            self.fig.tight_layout()
+        self.canvas.draw_idle()
+        
+        # Encode plot as image for PDF, rendered from the offscreen figure
+        # Kept in memory, so there is no temporary file to clean up at exit
+        self._draw_bars(self._pdf_ax, data)
+        self._pdf_fig.tight_layout()
+        buf = io.BytesIO()
+        self._pdf_canvas.print_png(buf)
+        self.plot_png = buf.getvalue()
+        self._last_plot_hash = plot_hash
+    
+    def _draw_bars(self, ax, data):
+        # Same number of bars as last time: move them instead of rebuilding the chart
+        bars = self._bars.get(ax)
+        if bars is not None and len(bars[0]) == len(data):
+            for rect, h in zip(bars[0], data['Min Loss']):
+                rect.set_height(h)
+            for rect, h in zip(bars[1], data['Max Loss']):
+                rect.set_height(h)
+            ax.set_xticklabels(data['Measurement'], rotation=45, ha='right')
+            ax.relim()
+            ax.autoscale_view()
+            return False
+        
+        ax.clear()
         
         # Set positions and width for the bars
         x = np.arange(len(data))
         width = 0.35
         
         # Plot min and max losses
-        self.ax.bar(x - width/2, data['Min Loss'], width, label='Min Loss')
-        self.ax.bar(x + width/2, data['Max Loss'], width, label='Max Loss')
+        self._bars[ax] = (
+            ax.bar(x - width/2, data['Min Loss'], width, label='Min Loss'),
+            ax.bar(x + width/2, data['Max Loss'], width, label='Max Loss'),
+        )
         
         # Labels and titles
-        self.ax.set_xlabel('Measurement')
-        self.ax.set_ylabel('Percentage Loss')
-        self.ax.set_title('Minimum and Maximum Percentage Loss per Measurement')
-        self.ax.set_xticks(x)
-        self.ax.set_xticklabels(data['Measurement'], rotation=45, ha='right')
-        self.ax.legend()
-        
-        self.fig.tight_layout()
-        self.canvas.draw()
-        
-        # Save plot as image for PDF
-        # Use a temporary file to avoid conflicts
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as tmpfile:
-            self.plot_path = tmpfile.name
-            self.fig.savefig(self.plot_path)
-        
-        # Register cleanup for temporary plot image
-        atexit.register(lambda: os.remove(self.plot_path) if os.path.exists(self.plot_path) else None)
+        ax.set_xlabel('Measurement')
+        ax.set_ylabel('Percentage Loss')
+        ax.set_title('Minimum and Maximum Percentage Loss per Measurement')
+        ax.set_xticks(x)
+        ax.set_xticklabels(data['Measurement'], rotation=45, ha='right')
+        ax.legend()
+        return True
     
     def generate_report(self):
         if self.grouped_data.empty:
@@ -291,7 +484,14 @@ class DataProcessorGUI:
             elements.append(Spacer(1, 12))
             
             # Table Data
-            table_data = [self.grouped_data.columns.tolist()] + self.grouped_data.values.tolist()
+            # Format the loss columns with one vectorized call each (4 decimals)
+            src = self.grouped_data
+            body = np.column_stack([
+                src['Measurement'].to_numpy(object),
+                np.char.mod('%.4f', src['Min Loss'].to_numpy(np.float64)),
+                np.char.mod('%.4f', src['Max Loss'].to_numpy(np.float64)),
+            ]).tolist()
+            table_data = [src.columns.tolist()] + body
             table = Table(table_data, colWidths=[250, 100, 100])
             table.setStyle(TableStyle([
                 ('BACKGROUND', (0,0), (-1,0), colors.grey),
@@ -306,8 +506,8 @@ class DataProcessorGUI:
             elements.append(Spacer(1, 12))
             
             # Add the plot image
-            if os.path.exists(self.plot_path):
-                img = Image(self.plot_path, width=500, height=300)
+            if self.plot_png is not None:
+                img = Image(io.BytesIO(self.plot_png), width=500, height=300)
                 elements.append(img)
             else:
                 elements.append(Paragraph("Plot image not found.", styles['Normal']))
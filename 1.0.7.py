@@ -1,18 +1,243 @@
 
 
 import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk, simpledialog
-from reportlab.lib.pagesizes import letter
-from reportlab.lib import colors
-from reportlab.platypus import Table, TableStyle, Image, Paragraph, Spacer, SimpleDocTemplate
-from reportlab.lib.styles import getSampleStyleSheet
 import os
+import datetime
 import numpy as np
 import tempfile
 import atexit
+import importlib.util
+import mmap
+import io
+import threading
+import queue
+from types import SimpleNamespace
+
+# First columns of the processed data header row in CSV files
+HEADER_PREFIX = b"Time,Metric,Value,Measurement"
+
+def find_csv_header_row(file_path):
+    """
+    Returns the line number of the processed data header in a CSV file,
+    or None if it isn't there.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None  # mmap can't map an empty file
+        
+        # Memory-map the file and find the header with one bytes search;
+        # the lines before it are counted without decoding them
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = mm.find(HEADER_PREFIX)
+            while pos != -1:
+                # Only a line that starts with the prefix (after optional whitespace)
+                # is the header; a preamble line may mention it further in
+                line_start = mm.rfind(b"\n", 0, pos) + 1
+                if not mm[line_start:pos].strip():
+                    return mm[:line_start].count(b"\n")
+                pos = mm.find(HEADER_PREFIX, pos + 1)
+            return None
+
+# Grouped min/max kernel compiled ahead of time by aot_build.py, when it has been
+# built; the frozen executable ships it so nothing is JIT-compiled at startup
+try:
+    from groupby_kernels import minmax as _aot_minmax
+except ImportError:
+    _aot_minmax = None
+
+# Optional JIT for the grouped min/max; pandas' groupby is used without either kernel
+njit = None
+if _aot_minmax is None:
+    try:
+        from numba import njit, types
+    except ImportError:
+        pass
+
+# Parse CSVs with pandas' multithreaded pyarrow engine when pyarrow is installed
+CSV_ENGINE = "pyarrow" if importlib.util.find_spec("pyarrow") else "c"
+
+if njit is not None:
+    # The explicit signature compiles (or loads from cache) at import, not on the first file.
+    # vals is typed read-only since pandas may hand out a read-only view; writable arrays match too
+    _MINMAX_SIGNATURE = types.Tuple((types.float64[:], types.float64[:], types.int64[:], types.int64))(
+        types.int64[:], types.Array(types.float64, 1, 'A', readonly=True), types.int64
+    )
+    
+    @njit(_MINMAX_SIGNATURE, cache=True)
+    def _minmax(codes, vals, n):
+        # Single sweep over the rows: rows without a loss value are only counted,
+        # the rest update a running min/max and row count per code
+        mn = np.full(n, np.inf)
+        mx = np.full(n, -np.inf)
+        counts = np.zeros(n, dtype=np.int64)
+        dropped = 0
+        for i in range(codes.size):
+            v = vals[i]
+            if np.isnan(v):
+                dropped += 1
+                continue
+            c = codes[i]
+            if c < 0:
+                continue  # missing Measurement, which groupby leaves out too
+            counts[c] += 1
+            if v < mn[c]:
+                mn[c] = v
+            if v > mx[c]:
+                mx[c] = v
+        return mn, mx, counts, dropped
+else:
+    _minmax = None
+
+def clean_and_group(df):
+    """
+    Cleans Percentage Loss and groups it by Measurement in one pass.
+    Returns (grouped, dropped): Measurement / Min Loss / Max Loss sorted by
+    Measurement, and the number of rows whose Percentage Loss wasn't a number.
+    """
+    losses = df['Percentage Loss']
+    if not pd.api.types.is_numeric_dtype(losses):
+        losses = pd.to_numeric(losses, errors='coerce')
+    
+    if _aot_minmax is None and _minmax is None:
+        # One validity mask filters just the two columns needed, instead of
+        # assigning the coerced column into a frame copy and then dropna'ing it
+        valid = losses.notna().to_numpy()
+        dropped = len(valid) - int(valid.sum())
+        grouped = losses[valid].groupby(df['Measurement'][valid], observed=True).agg(['min', 'max']).reset_index()
+        return grouped.rename(columns={'min': 'Min Loss', 'max': 'Max Loss'}), dropped
+    
+    # Factorize the labels once and reduce on the integer codes (missing labels get -1);
+    # no cleaned copy of the frame is built
+    codes, uniques = pd.factorize(df['Measurement'], sort=True)
+    vals = losses.to_numpy(dtype=np.float64, na_value=np.nan)
+    if _aot_minmax is not None:
+        # The AOT kernel only returns the extremes: rows without a loss value are
+        # counted here, and a Measurement with any value has min <= max
+        mn, mx = _aot_minmax(codes, vals, len(uniques))
+        dropped = np.isnan(vals).sum()
+        keep = mn <= mx
+    else:
+        mn, mx, counts, dropped = _minmax(codes, vals, len(uniques))
+        keep = counts > 0
+    
+    # Measurements whose every value was dropped don't appear, as with dropna + groupby
+    grouped = pd.DataFrame({'Measurement': uniques[keep], 'Min Loss': mn[keep], 'Max Loss': mx[keep]})
+    return grouped, int(dropped)
+
+# Optional Rust-based Excel reader; pandas' default Excel engines are used without it
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+# Optional virtualized table widget; the ttk Treeview is used without it
+try:
+    from tksheet import Sheet
+except ImportError:
+    Sheet = None
+
+# Rows inserted into the Treeview per idle callback
+TREE_INSERT_BATCH = 500
+
+# Files whose grouped data is kept for reprocessing, the least recently used dropped first
+PARSE_CACHE_SIZE = 8
+
+# Table column widths; the other columns are numbers
+MEASUREMENT_WIDTH = 300
+VALUE_WIDTH = 100
+
+# Columns read from the data sheet
+REQUIRED_COLUMNS = ["Measurement", "Percentage Loss"]
+_REQUIRED_SET = frozenset(REQUIRED_COLUMNS)
+
+def missing_columns(columns):
+    """
+    Returns the required columns not in columns, in REQUIRED_COLUMNS order
+    (empty if all are there). One set difference instead of a lookup per column.
+    """
+    missing = _REQUIRED_SET.difference(columns)
+    return [col for col in REQUIRED_COLUMNS if col in missing]
+
+def find_excel_headers_calamine(file_path):
+    """
+    Returns [(sheet, header_row), ...] for every sheet with a row whose first
+    cell starts with "Time", header_row being the first such row.
+    """
+    wb = CalamineWorkbook.from_path(file_path)
+    candidates = []
+    for sheet in wb.sheet_names:
+        # Keep leading empty rows so the index matches pandas' row numbers
+        rows = wb.get_sheet_by_name(sheet).to_python(skip_empty_area=False)
+        idx = next(
+            (i for i, row in enumerate(rows) if row and isinstance(row[0], str) and row[0].startswith("Time")),
+            None
+        )
+        if idx is not None:
+            candidates.append((sheet, idx))
+    return candidates
+
+# Rows parsed per sheet when looking for the header; the whole sheet only if it isn't in them
+HEADER_SCAN_ROWS = 50
+
+def first_time_row(frame):
+    """
+    Index of the first row of frame whose first cell starts with "Time", or None.
+    """
+    if frame.empty:
+        return None
+    matches = frame.iloc[:, 0].map(lambda v: isinstance(v, str) and v.startswith("Time")).to_numpy()
+    return int(matches.argmax()) if matches.any() else None
+
+def find_xlsx_headers(file_path):
+    """
+    Finds the header row (first cell starting with "Time") of each sheet of an .xlsx
+    workbook by streaming its rows with openpyxl, without loading any sheet into a
+    DataFrame. Returns [(sheet, row_index), ...] for the sheets that have one.
+    """
+    from openpyxl import load_workbook
+    wb = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        candidates = []
+        for sheet in wb.sheetnames:
+            for idx, row in enumerate(wb[sheet].iter_rows(values_only=True)):
+                if row and isinstance(row[0], str) and row[0].startswith("Time"):
+                    candidates.append((sheet, idx))
+                    break
+        return candidates
+    finally:
+        wb.close()
+
+# ReportLab names and the shared PDF styles, imported on the first report
+_rl = None
+
+def _lazy_rl():
+    """
+    Imports ReportLab on first use, so sessions that never build a PDF don't pay
+    for it at startup, and builds the PDF styles once.
+    """
+    global _rl
+    if _rl is None:
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib import colors
+        from reportlab.platypus import Table, TableStyle, Image, Paragraph, Spacer, SimpleDocTemplate
+        from reportlab.lib.styles import getSampleStyleSheet
+        _rl = SimpleNamespace(
+            letter=letter, Table=Table, Image=Image, Paragraph=Paragraph, Spacer=Spacer,
+            SimpleDocTemplate=SimpleDocTemplate,
+            styles=getSampleStyleSheet(),
+            table_style=TableStyle([
+                ('BACKGROUND', (0,0), (-1,0), colors.grey),
+                ('TEXTCOLOR',(0,0),(-1,0),colors.whitesmoke),
+                ('ALIGN',(0,0),(-1,-1),'CENTER'),
+                ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+                ('BOTTOMPADDING', (0,0), (-1,0), 12),
+                ('BACKGROUND',(0,1),(-1,-1),colors.beige),
+                ('GRID', (0,0), (-1,-1), 1, colors.black),
+            ])
+        )
+    return _rl
 
 class DataProcessorGUI:
     def __init__(self, master):
@@ -36,6 +261,22 @@ class DataProcessorGUI:
         self.overall_min_avg = None
         self.overall_max_avg = None
         
+        # Cleaned and grouped data (without the averages) per (file path, mtime, size),
+        # so reprocessing an unchanged file skips parsing it again
+        self._parse_cache = {}
+        self._sheet_prompted = False  # Whether the last Excel read asked for the sheet
+        self._base_grouped = None  # Grouped data of the last processed file
+        
+        self._insert_job = None  # Pending batch of Treeview inserts
+        self._plot_artists = None  # (layout, artists) of the current chart, updated in place on reruns
+        
+        # Temporary plot images still on disk, removed by one callback at exit
+        self._temp_plots = set()
+        atexit.register(self._cleanup_temps)
+        
+        # Results of PDFs built in background threads, shown by _poll_pdf_queue
+        self._pdf_queue = queue.Queue()
+        
         # Create GUI components
         self.create_widgets()
     
@@ -58,7 +299,8 @@ class DataProcessorGUI:
         chk_include_avg = tk.Checkbutton(
             frame_avg_options,
             text="Include Average per Measurement",
-            variable=self.include_average
+            variable=self.include_average,
+            command=self._recompute_derived
         )
         chk_include_avg.pack(side=tk.LEFT, padx=10)
         
@@ -66,7 +308,8 @@ class DataProcessorGUI:
         chk_include_overall_avg = tk.Checkbutton(
             frame_avg_options,
             text="Include Overall Averages",
-            variable=self.include_overall_average
+            variable=self.include_overall_average,
+            command=self._recompute_derived
         )
         chk_include_overall_avg.pack(side=tk.LEFT, padx=10)
         
@@ -84,34 +327,46 @@ class DataProcessorGUI:
         self.frame_data = tk.Frame(self.master)
         self.frame_data.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Initial Treeview setup
-        self.tree = ttk.Treeview(
-            self.frame_data,
-            columns=("Measurement", "Min Loss", "Max Loss"),
-            show='headings'
-        )
-        self.tree.heading("Measurement", text="Measurement")
-        self.tree.heading("Min Loss", text="Min Loss")
-        self.tree.heading("Max Loss", text="Max Loss")
-        
-        self.tree.column("Measurement", width=300)
-        self.tree.column("Min Loss", width=100, anchor='center')
-        self.tree.column("Max Loss", width=100, anchor='center')
-        
-        scrollbar = ttk.Scrollbar(self.frame_data, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscroll=scrollbar.set)
-        
-        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        if Sheet is not None:
+            # tksheet keeps the rows as a list model and only draws the visible cells
+            self.tree = None
+            self.sheet = Sheet(
+                self.frame_data,
+                headers=["Measurement", "Min Loss", "Max Loss"],
+                data=[],
+                show_row_index=False,
+                align="n"
+            )
+            self.sheet.set_column_widths([MEASUREMENT_WIDTH, VALUE_WIDTH, VALUE_WIDTH])
+            self.sheet.pack(fill=tk.BOTH, expand=True)
+        else:
+            self.sheet = None
+            
+            # Initial Treeview setup
+            self.tree = ttk.Treeview(
+                self.frame_data,
+                columns=("Measurement", "Min Loss", "Max Loss"),
+                show='headings'
+            )
+            self.tree.heading("Measurement", text="Measurement")
+            self.tree.heading("Min Loss", text="Min Loss")
+            self.tree.heading("Max Loss", text="Max Loss")
+            
+            self.tree.column("Measurement", width=MEASUREMENT_WIDTH)
+            self.tree.column("Min Loss", width=VALUE_WIDTH, anchor='center')
+            self.tree.column("Max Loss", width=VALUE_WIDTH, anchor='center')
+            
+            scrollbar = ttk.Scrollbar(self.frame_data, orient=tk.VERTICAL, command=self.tree.yview)
+            self.tree.configure(yscroll=scrollbar.set)
+            
+            self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Frame for plots
-        frame_plot = tk.Frame(self.master)
-        frame_plot.pack(pady=10)
+        # Frame for plots; the figure is created with the first plot
+        self.frame_plot = tk.Frame(self.master)
+        self.frame_plot.pack(pady=10)
         
-        self.fig, self.ax = plt.subplots(figsize=(10,5))
-        self.canvas = FigureCanvasTkAgg(self.fig, master=frame_plot)
-        self.canvas.draw()
-        self.canvas.get_tk_widget().pack()
+        self.fig = self.ax = self.canvas = None
         
         # Frame for report generation buttons
         frame_reports = tk.Frame(self.master)
@@ -169,57 +424,50 @@ class DataProcessorGUI:
             return
 
         try:
-            file_extension = os.path.splitext(self.data_file)[1].lower()
-            
-            # Determine file type and read accordingly
-            if file_extension == '.csv':
-                # Detect header row for CSV
-                df = self.read_csv_with_header_detection(self.data_file)
-            elif file_extension in ['.xlsx', '.xls']:
-                # Detect header row for Excel
-                df = self.read_excel_with_header_detection(self.data_file)
+            stat = os.stat(self.data_file)
+            key = (self.data_file, stat.st_mtime_ns, stat.st_size)
+            if key in self._parse_cache:
+                # Move the entry to the end, as the most recently used
+                grouped, dropped_rows = self._parse_cache[key] = self._parse_cache.pop(key)
             else:
-                messagebox.showerror("Error", "Unsupported file type selected.")
-                return
+                file_extension = os.path.splitext(self.data_file)[1].lower()
+                cacheable = True
+                
+                # Determine file type and read accordingly
+                if file_extension == '.csv':
+                    # Detect header row for CSV
+                    df = self.read_csv_with_header_detection(self.data_file)
+                elif file_extension in ['.xlsx', '.xls']:
+                    # Detect header row for Excel
+                    df = self.read_excel_with_header_detection(self.data_file)
+                    # A workbook whose sheet the user picked isn't cached, so the next
+                    # run asks again and another sheet can be chosen
+                    cacheable = not self._sheet_prompted
+                else:
+                    messagebox.showerror("Error", "Unsupported file type selected.")
+                    return
 
-            if df is None:
-                return  # Error message already shown in the read functions
+                if df is None:
+                    return  # Error message already shown in the read functions
 
-            # Data Cleaning
-            df['Percentage Loss'] = pd.to_numeric(df['Percentage Loss'], errors='coerce')
-            initial_row_count = df.shape[0]
-            df = df.dropna(subset=['Percentage Loss'])
-            cleaned_row_count = df.shape[0]
-            dropped_rows = initial_row_count - cleaned_row_count
+                # Data Cleaning and Grouping, on categorical labels so both work on
+                # integer codes instead of hashing strings. Converted after parsing
+                # rather than with dtype="category" in the readers: those categories
+                # are always strings, so numeric labels would sort as 1, 10, 2
+                df['Measurement'] = df['Measurement'].astype('category')
+                grouped, dropped_rows = clean_and_group(df)
+                if cacheable:
+                    self._parse_cache[key] = (grouped, dropped_rows)
+                    if len(self._parse_cache) > PARSE_CACHE_SIZE:
+                        del self._parse_cache[next(iter(self._parse_cache))]
 
             if dropped_rows > 0:
                 messagebox.showwarning("Warning", f"Dropped {dropped_rows} rows due to invalid 'Percentage Loss' values.")
 
-            # Grouping
-            grouped = df.groupby("Measurement")["Percentage Loss"].agg(['min', 'max']).reset_index()
-            grouped.rename(columns={'min': 'Min Loss', 'max': 'Max Loss'}, inplace=True)
-
-            # Calculate Average per Measurement if toggled on
-            if self.include_average.get():
-                grouped['Average'] = (grouped['Min Loss'] + grouped['Max Loss']) / 2
-
-            # Calculate Overall Averages if toggled on
-            if self.include_overall_average.get():
-                overall_min_avg = grouped['Min Loss'].mean()
-                overall_max_avg = grouped['Max Loss'].mean()
-                self.overall_min_avg = overall_min_avg
-                self.overall_max_avg = overall_max_avg
-            else:
-                self.overall_min_avg = None
-                self.overall_max_avg = None
-
-            self.grouped_data = grouped
+            self._base_grouped = grouped
 
-            # Update Treeview
-            self.update_table(grouped)
-
-            # Generate Plot
-            self.generate_plot(grouped)
+            # Averages, Treeview and Plot
+            self._recompute_derived()
 
             # Enable report buttons
             self.btn_report.config(state=tk.NORMAL)
@@ -231,32 +479,71 @@ class DataProcessorGUI:
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred while processing the data:\n{e}")
 
+    def _recompute_derived(self):
+        """
+        Applies the average checkboxes to the last processed data and refreshes
+        the table and plot, without reading the file again.
+        """
+        if self._base_grouped is None:
+            return  # Nothing processed yet
+
+        grouped = self._base_grouped
+
+        # Both averages come from the same (n, 2) array of min/max values
+        min_max = grouped[['Min Loss', 'Max Loss']].to_numpy()
+
+        # Calculate Average per Measurement if toggled on; assign returns a new
+        # frame, so the cached data stays free of the Average column
+        if self.include_average.get():
+            grouped = grouped.assign(Average=min_max.mean(axis=1))
+
+        # Calculate Overall Averages if toggled on
+        if self.include_overall_average.get():
+            self.overall_min_avg, self.overall_max_avg = min_max.mean(axis=0)
+        else:
+            self.overall_min_avg = None
+            self.overall_max_avg = None
+
+        self.grouped_data = grouped
+
+        # Update Treeview
+        self.update_table(grouped)
+
+        # Generate Plot
+        self.generate_plot(grouped)
+
     def read_csv_with_header_detection(self, file_path):
         try:
             # Detect header row by searching for the processed data header
-            with open(file_path, 'r', encoding='utf-8') as f:
-                for idx, line in enumerate(f):
-                    if line.strip().startswith("Time,Metric,Value,Measurement"):
-                        header_row = idx
-                        break
-                else:
-                    messagebox.showerror("Error", "Header row not found in the CSV file.")
-                    return None
-
-            # Read the CSV, skipping metadata rows
-            df = pd.read_csv(
-                file_path,
-                skiprows=range(0, header_row),
-                header=0,
-                encoding="utf-8"
-            )
+            header_row = find_csv_header_row(file_path)
+            if header_row is None:
+                messagebox.showerror("Error", "Header row not found in the CSV file.")
+                return None
 
-            # Validate required columns
-            required_columns = ["Measurement", "Percentage Loss"]
-            if not all(col in df.columns for col in required_columns):
-                messagebox.showerror("Error", f"CSV file must contain the following columns: {', '.join(required_columns)}")
+            # Validate required columns against the header row alone
+            columns = pd.read_csv(file_path, skiprows=header_row, header=0, nrows=0).columns
+            missing = missing_columns(columns)
+            if missing:
+                messagebox.showerror("Error", f"CSV file must contain the following columns: {', '.join(REQUIRED_COLUMNS)}\nMissing: {', '.join(missing)}")
                 return None
 
+            # Read only the required columns, skipping metadata rows
+            if CSV_ENGINE == "pyarrow":
+                # The pyarrow engine skips the lines above the header through header=
+                df = pd.read_csv(file_path, header=header_row, usecols=REQUIRED_COLUMNS, engine="pyarrow")
+            else:
+                # A line count in skiprows skips without a set lookup per line, and
+                # low_memory=False infers each column's type once for the whole file
+                # instead of per chunk
+                df = pd.read_csv(
+                    file_path,
+                    skiprows=header_row,
+                    header=0,
+                    usecols=REQUIRED_COLUMNS,
+                    engine="c",
+                    low_memory=False
+                )
+
             return df
 
         except pd.errors.EmptyDataError:
@@ -271,43 +558,63 @@ class DataProcessorGUI:
 
     def read_excel_with_header_detection(self, file_path):
         try:
-            # Read the entire Excel file to find the header row
-            xls = pd.ExcelFile(file_path)
-            sheet_names = xls.sheet_names  # List of sheet names
-            df = None
-            selected_sheet = None
-
-            # Search for header in all sheets
-            for sheet in sheet_names:
-                temp_df = pd.read_excel(file_path, sheet_name=sheet, header=None)
-                for idx, row in temp_df.iterrows():
-                    if isinstance(row[0], str) and row[0].startswith("Time"):
-                        # Assume this is the header row
-                        df = pd.read_excel(file_path, sheet_name=sheet, skiprows=range(0, idx), header=0)
-                        selected_sheet = sheet
-                        break
-                if df is not None:
-                    break
+            # Only the required columns are kept from the data sheet; any missing
+            # one is reported by the validation below
+            usecols = lambda col: col in REQUIRED_COLUMNS
+            xls = None  # Open ExcelFile handle of the .xls path
+            is_xlsx = os.path.splitext(file_path)[1].lower() == '.xlsx'
+            engine = "calamine" if CalamineWorkbook is not None else "openpyxl" if is_xlsx else None
+
+            # Collect every sheet with a header row as (sheet, header_row)
+            if CalamineWorkbook is not None:
+                # calamine parses the sheets natively
+                candidates = find_excel_headers_calamine(file_path)
+            elif is_xlsx:
+                # openpyxl streams the .xlsx rows in read-only mode
+                candidates = find_xlsx_headers(file_path)
+            else:
+                # .xls without calamine (openpyxl can't open it): open the workbook
+                # once and parse every sheet from that handle, looking at the first
+                # rows before parsing a whole sheet
+                xls = pd.ExcelFile(file_path)
+                candidates = []
+                for sheet in xls.sheet_names:
+                    temp_df = xls.parse(sheet_name=sheet, header=None, nrows=HEADER_SCAN_ROWS)
+                    idx = first_time_row(temp_df)
+                    if idx is None and len(temp_df) == HEADER_SCAN_ROWS:
+                        idx = first_time_row(xls.parse(sheet_name=sheet, header=None))
+                    if idx is not None:
+                        candidates.append((sheet, idx))
 
-            if df is None:
+            if not candidates:
                 messagebox.showerror("Error", "Header row not found in the Excel file.")
                 return None
 
             # If multiple sheets have the header, ask the user to choose
-            if sheet_names.count(selected_sheet) > 1:
+            selected_sheet, idx = candidates[0]
+            self._sheet_prompted = len(candidates) > 1
+            if self._sheet_prompted:
+                candidate_sheets = [sheet for sheet, _ in candidates]
                 selected_sheet = simpledialog.askstring(
                     "Select Sheet",
-                    f"Multiple sheets found. Enter the sheet name to use (Available sheets: {', '.join(sheet_names)}):"
+                    f"Multiple sheets found. Enter the sheet name to use (Available sheets: {', '.join(candidate_sheets)}):"
                 )
-                if selected_sheet not in sheet_names:
+                if selected_sheet not in candidate_sheets:
                     messagebox.showerror("Error", "Invalid sheet name entered.")
                     return None
-                df = pd.read_excel(file_path, sheet_name=selected_sheet, skiprows=range(0, idx), header=0)
+                idx = candidates[candidate_sheets.index(selected_sheet)][1]
+
+            # Parse only the selected sheet, from its header row on
+            if xls is not None:
+                df = xls.parse(sheet_name=selected_sheet, skiprows=range(0, idx), header=0, usecols=usecols)
+            else:
+                df = pd.read_excel(file_path, sheet_name=selected_sheet, skiprows=range(0, idx), header=0,
+                                   usecols=usecols, engine=engine)
 
             # Validate required columns
-            required_columns = ["Measurement", "Percentage Loss"]
-            if not all(col in df.columns for col in required_columns):
-                messagebox.showerror("Error", f"Excel file must contain the following columns: {', '.join(required_columns)}")
+            missing = missing_columns(df.columns)
+            if missing:
+                messagebox.showerror("Error", f"Excel file must contain the following columns: {', '.join(REQUIRED_COLUMNS)}\nMissing: {', '.join(missing)}")
                 return None
 
             return df
@@ -321,42 +628,38 @@ class DataProcessorGUI:
         except Exception as e:
             messagebox.showerror("Error", f"An unexpected error occurred while reading the Excel file:\n{e}")
             return None
+        finally:
+            if xls is not None:
+                xls.close()
 
     def update_table(self, data):
-        # Clear existing Treeview and scrollbar
-        for widget in self.frame_data.winfo_children():
-            widget.destroy()
-
         # Determine columns
         columns = list(data.columns)
+        widths = [MEASUREMENT_WIDTH if col == "Measurement" else VALUE_WIDTH for col in columns]
 
-        # Create new Treeview
-        self.tree = ttk.Treeview(
-            self.frame_data,
-            columns=columns,
-            show='headings'
-        )
-
-        # Define headings and column properties
-        for col in columns:
-            self.tree.heading(col, text=col)
-            if col == "Measurement":
-                self.tree.column(col, width=300)
-            else:
-                self.tree.column(col, width=100, anchor='center')
-
-        # Add scrollbar
-        scrollbar = ttk.Scrollbar(self.frame_data, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscroll=scrollbar.set)
+        if self.sheet is not None:
+            # The whole table is handed to tksheet in one call, formatted to strings
+            # column by column like the Treeview rows
+            self.sheet.set_sheet_data(data.astype(str).values.tolist(), reset_col_positions=False, redraw=False)
+            self.sheet.headers(columns, redraw=False)
+            self.sheet.set_column_widths(widths)
+            self.sheet.redraw()
+        else:
+            # Clear the existing Treeview; it and its scrollbar are reused, not rebuilt
+            self.clear_table()
+            self.tree.configure(columns=columns)
 
-        # Pack Treeview and scrollbar
-        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            # Define headings and column properties
+            for col, width in zip(columns, widths):
+                self.tree.heading(col, text=col)
+                if col == "Measurement":
+                    self.tree.column(col, width=width)
+                else:
+                    self.tree.column(col, width=width, anchor='center')
 
-        # Insert data
-        for _, row in data.iterrows():
-            values = [row[col] for col in columns]
-            self.tree.insert("", tk.END, values=values)
+            # Insert data as plain tuples rather than one Series per row, formatted to
+            # strings column by column up front instead of value by value by Tkinter
+            self.insert_rows(list(data.astype(str).itertuples(index=False, name=None)))
         
         # Display Overall Averages if available
         if self.overall_min_avg is not None and self.overall_max_avg is not None:
@@ -389,45 +692,125 @@ class DataProcessorGUI:
                 self.lbl_overall_avg_max.destroy()
                 self.lbl_overall_avg_max = None
 
-    def generate_plot(self, data):
-        self.ax.clear()
-        
-        # Set positions and width for the bars
-        x = np.arange(len(data))
-        width = 0.35
+    def insert_rows(self, rows, start=0):
+        """
+        Inserts rows into the Treeview a batch at a time, handing control back
+        to Tk between batches so a long result doesn't stall the window.
+        """
+        end = start + TREE_INSERT_BATCH
+        for values in rows[start:end]:
+            self.tree.insert("", tk.END, values=values)
         
-        # Plot min and max losses
-        self.ax.bar(x - width/2, data['Min Loss'], width, label='Min Loss')
-        self.ax.bar(x + width/2, data['Max Loss'], width, label='Max Loss')
+        if end < len(rows):
+            self._insert_job = self.tree.after_idle(self.insert_rows, rows, end)
+        else:
+            self._insert_job = None
+    
+    def clear_table(self):
+        """
+        Removes every row, cancelling any batch insert_rows still has queued.
+        """
+        if self._insert_job is not None:
+            self.tree.after_cancel(self._insert_job)
+            self._insert_job = None
+        # One delete call for all rows instead of one Tcl round-trip per row
+        self.tree.delete(*self.tree.get_children())
+
+    def create_plot_canvas(self):
+        """
+        Creates the embedded figure. matplotlib is imported here, on the first plot,
+        so it doesn't delay opening the window.
+        """
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
         
-        # Plot average loss per measurement if it exists
-        if 'Average' in data.columns:
-            self.ax.bar(x, data['Average'], width=0.1, label='Average Loss')  # Adjust width as needed
+        self.fig = Figure(figsize=(10,5))
+        self.ax = self.fig.add_subplot()
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.frame_plot)
+        self.canvas.get_tk_widget().pack()
+
+    def generate_plot(self, data):
+        if self.canvas is None:
+            self.create_plot_canvas()
         
-        # Plot Overall Averages if they exist
-        if self.overall_min_avg is not None and self.overall_max_avg is not None:
-            self.ax.axhline(y=self.overall_min_avg, color='blue', linestyle='--', label='Overall Avg Min Loss')
-            self.ax.axhline(y=self.overall_max_avg, color='orange', linestyle='--', label='Overall Avg Max Loss')
+        has_overall = self.overall_min_avg is not None and self.overall_max_avg is not None
+        layout = (len(data), 'Average' in data.columns, has_overall)
         
-        # Labels and titles
-        self.ax.set_xlabel('Measurement')
-        self.ax.set_ylabel('Percentage Loss')
-        self.ax.set_title('Percentage Loss per Measurement')
-        self.ax.set_xticks(x)
-        self.ax.set_xticklabels(data['Measurement'], rotation=45, ha='right')
-        self.ax.legend()
+        if self._plot_artists is not None and self._plot_artists[0] == layout:
+            # Same bars and lines as the current chart: move them instead of rebuilding it
+            artists = self._plot_artists[1]
+            for name, col in (('min', 'Min Loss'), ('max', 'Max Loss'), ('avg', 'Average')):
+                if name in artists:
+                    for rect, h in zip(artists[name], data[col]):
+                        rect.set_height(h)
+            if has_overall:
+                artists['overall_min'].set_ydata([self.overall_min_avg, self.overall_min_avg])
+                artists['overall_max'].set_ydata([self.overall_max_avg, self.overall_max_avg])
+            self.ax.set_xticklabels(data['Measurement'], rotation=45, ha='right')
+            self.ax.relim()
+            self.ax.autoscale_view()
+        else:
+            self.ax.clear()
+            artists = {}
+            
+            # Set positions and width for the bars
+            x = np.arange(len(data))
+            width = 0.35
+            
+            # Plot min and max losses
+            artists['min'] = self.ax.bar(x - width/2, data['Min Loss'], width, label='Min Loss')
+            artists['max'] = self.ax.bar(x + width/2, data['Max Loss'], width, label='Max Loss')
+            
+            # Plot average loss per measurement if it exists
+            if 'Average' in data.columns:
+                artists['avg'] = self.ax.bar(x, data['Average'], width=0.1, label='Average Loss')  # Adjust width as needed
+            
+            # Plot Overall Averages if they exist
+            if has_overall:
+                artists['overall_min'] = self.ax.axhline(y=self.overall_min_avg, color='blue', linestyle='--', label='Overall Avg Min Loss')
+                artists['overall_max'] = self.ax.axhline(y=self.overall_max_avg, color='orange', linestyle='--', label='Overall Avg Max Loss')
+            
+            # Labels and titles
+            self.ax.set_xlabel('Measurement')
+            self.ax.set_ylabel('Percentage Loss')
+            self.ax.set_title('Percentage Loss per Measurement')
+            self.ax.set_xticks(x)
+            self.ax.set_xticklabels(data['Measurement'], rotation=45, ha='right')
+            self.ax.legend()
+            self._plot_artists = (layout, artists)
         
         self.fig.tight_layout()
-        self.canvas.draw()
+        self.canvas.draw_idle()
         
         # Save plot as image for PDF
         # Use a temporary file to avoid conflicts
+        previous_path = self.plot_path
         with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as tmpfile:
             self.plot_path = tmpfile.name
-            self.fig.savefig(self.plot_path)
+            # The PDF shows it at 500x300 points, so 72 DPI is enough; trim the
+            # margins and use a fast zlib level
+            self.fig.savefig(self.plot_path, dpi=72, bbox_inches='tight', pad_inches=0.05,
+                             pil_kwargs={'compress_level': 3})
+        self._temp_plots.add(self.plot_path)
         
-        # Register cleanup for temporary plot image
-        atexit.register(lambda: os.remove(self.plot_path) if os.path.exists(self.plot_path) else None)
+        # Reports read the image when they start, so the previous one is no longer needed
+        if previous_path in self._temp_plots:
+            self._temp_plots.discard(previous_path)
+            try:
+                os.remove(previous_path)
+            except OSError:
+                pass
+
+    def _cleanup_temps(self):
+        """
+        Removes the temporary plot images still on disk; registered once with atexit.
+        """
+        for path in self._temp_plots:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._temp_plots.clear()
 
     def generate_report(self):
         if self.grouped_data.empty:
@@ -444,59 +827,117 @@ class DataProcessorGUI:
             if not report_path:
                 return  # User cancelled
             
-            # Use ReportLab's Platypus for better layout management
-            doc = SimpleDocTemplate(report_path, pagesize=letter)
-            styles = getSampleStyleSheet()
-            elements = []
-            
-            # Title
-            title = Paragraph("Data Processing Report", styles['Heading1'])
-            elements.append(title)
-            elements.append(Spacer(1, 12))
-            
-            # Timestamp
-            timestamp = Paragraph(f"Report generated on: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal'])
-            elements.append(timestamp)
-            elements.append(Spacer(1, 12))
-            
-            # Table Data
-            table_data = [self.grouped_data.columns.tolist()] + self.grouped_data.values.tolist()
-            col_widths = [250, 100, 100, 100] if 'Average' in self.grouped_data.columns else [250, 100, 100]
-            table = Table(table_data, colWidths=col_widths)
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0,0), (-1,0), colors.grey),
-                ('TEXTCOLOR',(0,0),(-1,0),colors.whitesmoke),
-                ('ALIGN',(0,0),(-1,-1),'CENTER'),
-                ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-                ('BOTTOMPADDING', (0,0), (-1,0), 12),
-                ('BACKGROUND',(0,1),(-1,-1),colors.beige),
-                ('GRID', (0,0), (-1,-1), 1, colors.black),
-            ]))
-            elements.append(table)
-            elements.append(Spacer(1, 12))
-            
-            # Add Overall Averages if they exist
-            if self.overall_min_avg is not None and self.overall_max_avg is not None:
-                overall_avg_min = Paragraph(f"Overall Average Min Loss: {self.overall_min_avg:.2f}", styles['Normal'])
-                overall_avg_max = Paragraph(f"Overall Average Max Loss: {self.overall_max_avg:.2f}", styles['Normal'])
-                elements.append(overall_avg_min)
-                elements.append(overall_avg_max)
-                elements.append(Spacer(1, 12))
-            
-            # Add the plot image
-            if os.path.exists(self.plot_path):
-                img = Image(self.plot_path, width=500, height=300)
-                elements.append(img)
-            else:
-                elements.append(Paragraph("Plot image not found.", styles['Normal']))
-            
-            # Build the PDF
-            doc.build(elements)
-            messagebox.showinfo("Success", f"Report generated successfully at:\n{report_path}")
+            self._start_pdf(
+                report_path,
+                f"Report generated successfully at:\n{report_path}",
+                "An error occurred while generating the report"
+            )
         
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred while generating the report:\n{e}")
 
+    def _start_pdf(self, path, success_message, error_prefix):
+        """
+        Builds the PDF report in a background thread so the window stays responsive.
+        The outcome is reported on the Tk thread by _poll_pdf_queue.
+        """
+        # Snapshot what the report needs, including the plot as PNG bytes, so the
+        # thread never touches Tk or the figure
+        try:
+            with open(self.plot_path, 'rb') as f:
+                plot_png = f.read()
+        except FileNotFoundError:
+            plot_png = None  # The report notes the missing plot
+        report = (path, self.grouped_data, self.overall_min_avg, self.overall_max_avg, plot_png)
+        
+        threading.Thread(
+            target=self._pdf_worker,
+            args=(report, success_message, error_prefix),
+            daemon=True
+        ).start()
+        self.master.after(100, self._poll_pdf_queue)
+
+    def _pdf_worker(self, report, success_message, error_prefix):
+        try:
+            self._build_pdf(*report)
+        except Exception as e:
+            self._pdf_queue.put(("Error", f"{error_prefix}:\n{e}"))
+        else:
+            self._pdf_queue.put(("Success", success_message))
+
+    def _poll_pdf_queue(self):
+        try:
+            title, message = self._pdf_queue.get_nowait()
+        except queue.Empty:
+            self.master.after(100, self._poll_pdf_queue)
+            return
+        if title == "Error":
+            messagebox.showerror(title, message)
+        else:
+            messagebox.showinfo(title, message)
+
+    def _build_pdf(self, path, grouped_data, overall_min_avg, overall_max_avg, plot_png):
+        """
+        Writes the PDF report (title, timestamp, table, overall averages and plot) to path.
+        Runs in a background thread: it only uses its arguments and the prebuilt styles.
+        """
+        rl = _lazy_rl()
+        
+        # Use ReportLab's Platypus for better layout management
+        doc = rl.SimpleDocTemplate(path, pagesize=rl.letter)
+        styles = rl.styles
+        elements = []
+        
+        # Title
+        title = rl.Paragraph("Data Processing Report", styles['Heading1'])
+        elements.append(title)
+        elements.append(rl.Spacer(1, 12))
+        
+        # Timestamp
+        timestamp = rl.Paragraph(f"Report generated on: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal'])
+        elements.append(timestamp)
+        elements.append(rl.Spacer(1, 12))
+        
+        # Table Data, as tuples which ReportLab walks faster than lists
+        table_data = (tuple(grouped_data.columns),) + tuple(map(tuple, grouped_data.values.tolist()))
+        col_widths = [250, 100, 100, 100] if 'Average' in grouped_data.columns else [250, 100, 100]
+        table = rl.Table(table_data, colWidths=col_widths)
+        table.setStyle(rl.table_style)
+        elements.append(table)
+        elements.append(rl.Spacer(1, 12))
+        
+        # Add Overall Averages if they exist
+        if overall_min_avg is not None and overall_max_avg is not None:
+            overall_avg_min = rl.Paragraph(f"Overall Average Min Loss: {overall_min_avg:.2f}", styles['Normal'])
+            overall_avg_max = rl.Paragraph(f"Overall Average Max Loss: {overall_max_avg:.2f}", styles['Normal'])
+            elements.append(overall_avg_min)
+            elements.append(overall_avg_max)
+            elements.append(rl.Spacer(1, 12))
+        
+        # Add the plot image
+        if plot_png is not None:
+            img = rl.Image(io.BytesIO(plot_png), width=500, height=300)
+            elements.append(img)
+        else:
+            elements.append(rl.Paragraph("Plot image not found.", styles['Normal']))
+        
+        # Build the PDF
+        doc.build(elements)
+
+    def _write_csv(self, path):
+        """
+        Writes grouped_data to path, followed by the overall averages if they exist.
+        """
+        # One open and one handle for the table and the averages, instead of
+        # writing the table and then reopening the file to append
+        with open(path, 'w', encoding='utf-8') as f:
+            self.grouped_data.to_csv(f, index=False, lineterminator="\n")
+            if self.overall_min_avg is not None and self.overall_max_avg is not None:
+                f.write(
+                    f"\nOverall Average Min Loss,,{self.overall_min_avg:.2f}\n"
+                    f"Overall Average Max Loss,,{self.overall_max_avg:.2f}\n"
+                )
+
     def save_csv_report(self):
         if self.grouped_data.empty:
             messagebox.showerror("Error", "No data to save. Please process data first.")
@@ -530,14 +971,7 @@ class DataProcessorGUI:
                     return  # User chose not to overwrite
             
             # Save the grouped_data DataFrame to the specified CSV file
-            self.grouped_data.to_csv(save_path, index=False)
-            
-            # Append Overall Averages if they exist
-            if self.overall_min_avg is not None and self.overall_max_avg is not None:
-                with open(save_path, 'a') as f:
-                    f.write("\n")  # Add a newline before averages
-                    f.write(f"Overall Average Min Loss,,{self.overall_min_avg:.2f}\n")
-                    f.write(f"Overall Average Max Loss,,{self.overall_max_avg:.2f}\n")
+            self._write_csv(save_path)
             
             messagebox.showinfo("Success", f"CSV report saved successfully at:\n{save_path}")
         
@@ -575,67 +1009,13 @@ class DataProcessorGUI:
                     return  # User chose not to overwrite
             
             # Save CSV
-            self.grouped_data.to_csv(csv_path, index=False)
-            
-            # Append Overall Averages if they exist
-            if self.overall_min_avg is not None and self.overall_max_avg is not None:
-                with open(csv_path, 'a') as f:
-                    f.write("\n")  # Add a newline before averages
-                    f.write(f"Overall Average Min Loss,,{self.overall_min_avg:.2f}\n")
-                    f.write(f"Overall Average Max Loss,,{self.overall_max_avg:.2f}\n")
+            self._write_csv(csv_path)
             
             # Generate PDF
-            doc = SimpleDocTemplate(pdf_path, pagesize=letter)
-            styles = getSampleStyleSheet()
-            elements = []
-            
-            # Title
-            title = Paragraph("Data Processing Report", styles['Heading1'])
-            elements.append(title)
-            elements.append(Spacer(1, 12))
-            
-            # Timestamp
-            timestamp = Paragraph(f"Report generated on: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal'])
-            elements.append(timestamp)
-            elements.append(Spacer(1, 12))
-            
-            # Table Data
-            table_data = [self.grouped_data.columns.tolist()] + self.grouped_data.values.tolist()
-            col_widths = [250, 100, 100, 100] if 'Average' in self.grouped_data.columns else [250, 100, 100]
-            table = Table(table_data, colWidths=col_widths)
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0,0), (-1,0), colors.grey),
-                ('TEXTCOLOR',(0,0),(-1,0),colors.whitesmoke),
-                ('ALIGN',(0,0),(-1,-1),'CENTER'),
-                ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-                ('BOTTOMPADDING', (0,0), (-1,0), 12),
-                ('BACKGROUND',(0,1),(-1,-1),colors.beige),
-                ('GRID', (0,0), (-1,-1), 1, colors.black),
-            ]))
-            elements.append(table)
-            elements.append(Spacer(1, 12))
-            
-            # Add Overall Averages if they exist
-            if self.overall_min_avg is not None and self.overall_max_avg is not None:
-                overall_avg_min = Paragraph(f"Overall Average Min Loss: {self.overall_min_avg:.2f}", styles['Normal'])
-                overall_avg_max = Paragraph(f"Overall Average Max Loss: {self.overall_max_avg:.2f}", styles['Normal'])
-                elements.append(overall_avg_min)
-                elements.append(overall_avg_max)
-                elements.append(Spacer(1, 12))
-            
-            # Add the plot image
-            if os.path.exists(self.plot_path):
-                img = Image(self.plot_path, width=500, height=300)
-                elements.append(img)
-            else:
-                elements.append(Paragraph("Plot image not found.", styles['Normal']))
-            
-            # Build the PDF
-            doc.build(elements)
-            
-            messagebox.showinfo(
-                "Success",
-                f"Reports generated successfully at:\nPDF: {pdf_path}\nCSV: {csv_path}"
+            self._start_pdf(
+                pdf_path,
+                f"Reports generated successfully at:\nPDF: {pdf_path}\nCSV: {csv_path}",
+                "An error occurred while exporting the reports"
             )
         
         except Exception as e:
@@ -0,0 +1,45 @@
+"""
+Compiles the grouped min/max kernel ahead of time into the groupby_kernels
+extension module (groupby_kernels.*.pyd on Windows, .so elsewhere) next to
+this file. 1.0.2.py, 1.0.7.py and report_gerantion_for_lossvalidation.py
+import it when present instead of JIT-compiling the kernel with numba, and
+setup.py ships it with the executable frozen from 1.0.7.py.
+
+Run once per platform and Python version, before building with setup.py:
+    python aot_build.py
+"""
+import os
+import numpy as np
+from numba import types
+from numba.pycc import CC
+
+cc = CC('groupby_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Same types as the JIT kernel: intp codes (-1 for a missing label) and float64
+# values, read-only since pandas may hand out read-only views
+MINMAX_SIGNATURE = types.UniTuple(types.float64[:], 2)(
+    types.Array(types.intp, 1, 'A', readonly=True),
+    types.Array(types.float64, 1, 'A', readonly=True),
+    types.int64
+)
+
+@cc.export('minmax', MINMAX_SIGNATURE)
+def minmax(codes, vals, n):
+    # Single pass; AOT compilation has no parallel=True, so unlike the JIT
+    # kernel this doesn't split the rows across threads
+    mn = np.full(n, np.inf)
+    mx = np.full(n, -np.inf)
+    for i in range(codes.size):
+        c = codes[i]
+        if c < 0:
+            continue  # missing Measurement, which groupby leaves out too
+        v = vals[i]  # NaN fails both comparisons, so it is skipped
+        if v < mn[c]:
+            mn[c] = v
+        if v > mx[c]:
+            mx[c] = v
+    return mn, mx
+
+if __name__ == "__main__":
+    cc.compile()
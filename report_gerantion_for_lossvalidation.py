@@ -1,14 +1,307 @@
 import pandas as pd
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
 from reportlab.lib import colors
-from reportlab.platypus import Table, TableStyle, Image, Paragraph, Spacer
+from reportlab.platypus import LongTable, TableStyle, Image, Paragraph, Spacer, SimpleDocTemplate
 from reportlab.lib.styles import getSampleStyleSheet
 import os
+import glob
+import hashlib
+import re
+import io
+import mmap
+import codecs
+import time
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+# First columns of the processed data header row
+HEADER_PREFIX = "Time,Metric,Value,Measurement"
+
+# The only columns used from the data rows
+REQUIRED_COLUMNS = ["Measurement", "Percentage Loss"]
+
+# Above this many rows the Treeview is unpacked while filling it, so Tk doesn't
+# lay it out again after every insert
+TREE_DETACH_ROWS = 5000
+
+# Format of the "Report generated on" line
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# How often the Tk thread checks whether background processing has finished (ms)
+PROCESS_POLL_MS = 50
+
+class DataFileError(Exception):
+    """
+    A CSV file that can't be processed; the message is shown to the user as is.
+    """
+
+# PDF styles, built once instead of on every report
+_STYLES = getSampleStyleSheet()
+_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0,0), (-1,0), colors.grey),
+    ('TEXTCOLOR',(0,0),(-1,0),colors.whitesmoke),
+    ('ALIGN',(0,0),(-1,-1),'CENTER'),
+    ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+    ('BOTTOMPADDING', (0,0), (-1,0), 12),
+    ('BACKGROUND',(0,1),(-1,-1),colors.beige),
+    ('GRID', (0,0), (-1,-1), 1, colors.black),
+])
+
+# Heights ReportLab computes for the header and a single-line row with _TABLE_STYLE
+HEADER_ROW_HEIGHT = 27
+ROW_HEIGHT = 18
+
+@functools.lru_cache(maxsize=16)
+def _layout_for(bucket):
+    """
+    Returns (style, col_widths, row_heights) for tables of up to bucket rows.
+    Fixed row heights spare ReportLab measuring every cell; slice them to the
+    actual row count.
+    """
+    return _TABLE_STYLE, (250, 100, 100), (HEADER_ROW_HEIGHT,) + (ROW_HEIGHT,) * bucket
+
+def find_header_row(csv_file):
+    """
+    Returns the line number of the processed data header, or None if the file
+    doesn't have one. The file is memory-mapped and searched for the header
+    with one native substring scan instead of decoding it line by line.
+    """
+    needle = HEADER_PREFIX.encode()
+    with open(csv_file, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return None  # Empty file, nothing to map
+    with mm:
+        pos = mm.find(needle)
+        while pos != -1:
+            # Like the parsers, treat \n, \r\n and a lone \r as line breaks
+            line_start = max(mm.rfind(b'\n', 0, pos), mm.rfind(b'\r', 0, pos)) + 1
+            # Only whitespace (or the BOM on the first line) may precede the header
+            lead = mm[line_start:pos]
+            if line_start == 0:
+                lead = lead.removeprefix(codecs.BOM_UTF8)
+            if not lead.strip():
+                before = mm[:line_start]
+                return before.count(b'\n') + before.count(b'\r') - before.count(b'\r\n')
+            pos = mm.find(needle, pos + 1)
+    return None
+
+# Optional multithreaded Arrow CSV reader; pandas' C parser is used without it
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+# Optional: embed the plot in the PDF as vector graphics instead of a PNG
+try:
+    from svglib.svglib import svg2rlg
+except ImportError:
+    svg2rlg = None
+
+def clean_losses(df):
+    """
+    Converts Percentage Loss to numbers; values that aren't become NaN.
+    Returns (df, dropped_rows). The NaN rows are left in place instead of
+    copying the frame without them: group_min_max skips NaN values.
+    """
+    # The C parser already typed an all-numeric column as float (or int), with
+    # blanks and NA markers as NaN; only text columns need coercing
+    if not pd.api.types.is_numeric_dtype(df['Percentage Loss']):
+        df['Percentage Loss'] = pd.to_numeric(df['Percentage Loss'], errors='coerce')
+    losses = df['Percentage Loss'].to_numpy()
+    dropped_rows = int(np.count_nonzero(np.isnan(losses))) if losses.dtype.kind == 'f' else 0
+    return df, dropped_rows
+
+def read_data_arrow(csv_file, header_row):
+    """
+    Reads Measurement and Percentage Loss from header_row on with Arrow's
+    multithreaded CSV reader. Returns (df, dropped_rows) from clean_losses, or
+    None if Arrow can't read the file (missing column, ragged rows), in which
+    case the caller uses pandas.
+    """
+    try:
+        table = pa_csv.read_csv(
+            csv_file,
+            read_options=pa_csv.ReadOptions(skip_rows=header_row),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=REQUIRED_COLUMNS,
+                # Labels as a dictionary column, which becomes a pandas categorical
+                column_types={'Measurement': pa.dictionary(pa.int32(), pa.string())},
+                strings_can_be_null=True  # Empty labels are missing, as in pandas
+            )
+        )
+    except (pa.ArrowInvalid, KeyError):
+        return None
+    
+    # Nulls in a numeric column arrive as NaN; text columns are coerced
+    return clean_losses(table.to_pandas())
+
+def sidecar_path(csv_file):
+    """
+    Returns the path of the Parquet cache for csv_file: the CSV's name plus a key
+    hashed from its first MB, size and modification time, so an edited file gets
+    a new cache without hashing all of it.
+    """
+    stat = os.stat(csv_file)
+    with open(csv_file, 'rb') as f:
+        key = hashlib.blake2b(f.read(1 << 20), digest_size=8)
+    key.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return f"{csv_file}.{key.hexdigest()}.parquet"
+
+# What sidecar_path appends to the CSV's name; only files named like this are
+# removed as old caches
+SIDECAR_SUFFIX = re.compile(r'\.[0-9a-f]{16}\.parquet')
+
+def read_sidecar(path):
+    """
+    Returns (df, dropped_rows) from a Parquet cache written by write_sidecar,
+    or None if there is no usable cache at path (missing, unreadable, or
+    without the columns and dropped_rows count write_sidecar saves).
+    """
+    try:
+        table = pq.read_table(path)
+        dropped_rows = int(table.schema.metadata[b'dropped_rows'])
+    except (OSError, pa.ArrowException, KeyError, TypeError, ValueError):
+        return None
+    df = table.to_pandas()
+    if list(df.columns) != ['Measurement', 'Percentage Loss'] or not pd.api.types.is_float_dtype(df['Percentage Loss']):
+        return None
+    return df, dropped_rows
+
+def write_sidecar(csv_file, path, df, dropped_rows):
+    """
+    Saves the cleaned Measurement / Percentage Loss columns to a Parquet cache
+    next to the CSV, replacing the caches of older versions of the file. A
+    folder that can't be written to just means no cache.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata({**table.schema.metadata, b'dropped_rows': str(dropped_rows).encode()})
+    try:
+        for old_path in glob.glob(glob.escape(csv_file) + '.*.parquet'):
+            if SIDECAR_SUFFIX.fullmatch(old_path[len(csv_file):]):
+                os.remove(old_path)
+        pq.write_table(table, path, compression='zstd')
+    except OSError:
+        pass
+
+# Optional ahead-of-time compiled grouped min/max, built by aot_build.py. With it
+# numba isn't imported at all, so there is no JIT compile or cache load at startup
+try:
+    from groupby_kernels import minmax as _aot_minmax
+except ImportError:
+    _aot_minmax = None
+
+# Optional JIT for the grouped min/max; numpy's ufunc.at is used without numba
+njit = None
+if _aot_minmax is None:
+    try:
+        from numba import njit, prange, get_num_threads, types
+    except ImportError:
+        pass
+
+if njit is not None:
+    # The explicit signature compiles (or loads from cache) at import, not on the first file.
+    # The arrays are typed read-only since pandas may hand out read-only views; writable ones match too
+    _MINMAX_SIGNATURE = types.UniTuple(types.float64[:], 2)(
+        types.Array(types.intp, 1, 'A', readonly=True),
+        types.Array(types.float64, 1, 'A', readonly=True),
+        types.int64,
+        types.int64
+    )
+    
+    @njit(_MINMAX_SIGNATURE, parallel=True, cache=True, nogil=True)
+    def _minmax(codes, vals, n, threads):
+        # Each thread sweeps its own slice of the rows into its own row of
+        # partial results, so no two threads write the same element
+        part_mn = np.full((threads, n), np.inf)
+        part_mx = np.full((threads, n), -np.inf)
+        for t in prange(threads):
+            lo = t * codes.size // threads
+            hi = (t + 1) * codes.size // threads
+            for i in range(lo, hi):
+                c = codes[i]
+                if c < 0:
+                    continue  # missing Measurement, which groupby leaves out too
+                v = vals[i]  # NaN fails both comparisons, so it is skipped
+                if v < part_mn[t, c]:
+                    part_mn[t, c] = v
+                if v > part_mx[t, c]:
+                    part_mx[t, c] = v
+        
+        # Combine the partial results
+        mn = part_mn[0].copy()
+        mx = part_mx[0].copy()
+        for t in range(1, threads):
+            for c in range(n):
+                if part_mn[t, c] < mn[c]:
+                    mn[c] = part_mn[t, c]
+                if part_mx[t, c] > mx[c]:
+                    mx[c] = part_mx[t, c]
+        return mn, mx
+else:
+    _minmax = None
+
+def factorize_categories(labels):
+    """
+    pd.factorize(labels, sort=True) for categorical labels, computed on the
+    categories instead of the rows. Categories read as text are turned back into
+    numbers when they all are, so they sort and show as a plain read would.
+    """
+    categories = labels.cat.categories
+    if not pd.api.types.is_numeric_dtype(categories):
+        numeric = pd.to_numeric(categories, errors='coerce')
+        if numeric.notna().all():
+            categories = numeric
+    # Categories equal as numbers (e.g. "1" and "1.0") share a code
+    category_codes, uniques = pd.factorize(categories, sort=True)
+    # A trailing -1 maps the row code of a missing label (-1) to -1
+    category_codes = np.append(category_codes, -1)
+    return category_codes[labels.cat.codes.to_numpy()], uniques
+
+def group_min_max(labels, values):
+    """
+    Returns a DataFrame with the Min Loss and Max Loss of values per label, sorted
+    by label, like groupby(...).agg(['min', 'max']). The labels are factorized once
+    and both extremes are taken in the same pass over the codes; missing labels
+    and NaN values are left out. Integer values keep their dtype, as with groupby.
+    """
+    if isinstance(labels.dtype, pd.CategoricalDtype):
+        # Factorize only the categories and map the row codes through them, so no
+        # label string is hashed per row
+        codes, uniques = factorize_categories(labels)
+    else:
+        codes, uniques = pd.factorize(labels, sort=True)
+    
+    if _aot_minmax is not None:
+        mn, mx = _aot_minmax(codes, values.astype(np.float64, copy=False), len(uniques))
+    elif _minmax is not None:
+        mn, mx = _minmax(codes, values.astype(np.float64, copy=False), len(uniques), get_num_threads())
+    else:
+        keep = codes >= 0
+        codes = codes[keep]
+        values = values[keep]
+        
+        mn = np.full(len(uniques), np.inf)
+        mx = np.full(len(uniques), -np.inf)
+        # fmin/fmax ignore NaN, like the comparisons in the kernel
+        np.fmin.at(mn, codes, values)
+        np.fmax.at(mx, codes, values)
+    
+    # Labels with no value left (unused categories, or only NaN) have no min/max
+    present = mn <= mx
+    if not present.all():
+        uniques, mn, mx = uniques[present], mn[present], mx[present]
+    if values.dtype.kind in 'iu':
+        mn = mn.astype(values.dtype)
+        mx = mx.astype(values.dtype)
+    return pd.DataFrame({'Measurement': uniques, 'Min Loss': mn, 'Max Loss': mx})
 
 class DataProcessorGUI:
     def __init__(self, master):
@@ -19,7 +312,17 @@ class DataProcessorGUI:
         # Initialize variables
         self.csv_file = ""
         self.grouped_data = pd.DataFrame()
-        self.plot_path = "plot.png"
+        
+        # Bars of the current chart, updated in place when the group count is unchanged
+        self.bars_min = None
+        self.bars_max = None
+        self.plot_labels = None
+        # Canvas region of the axes without bars and legend, and the canvas size it was taken at
+        self.background = None
+        self.background_size = None
+        
+        # Reading and grouping run here so the Tk event loop keeps running
+        self.pool = ThreadPoolExecutor(max_workers=1)
         
         # Create GUI components
         self.create_widgets()
@@ -36,8 +339,12 @@ class DataProcessorGUI:
         self.lbl_file.pack(side=tk.LEFT, padx=5)
         
         # Process Button
-        btn_process = tk.Button(self.master, text="Process Data", command=self.process_data, bg="green", fg="white")
-        btn_process.pack(pady=10)
+        self.btn_process = tk.Button(self.master, text="Process Data", command=self.process_data, bg="green", fg="white")
+        self.btn_process.pack(pady=10)
+        
+        # Runs while the data is processed in the background
+        self.progress = ttk.Progressbar(self.master, mode='indeterminate', length=300)
+        self.progress.pack(pady=5)
         
         # Frame for data display
         frame_data = tk.Frame(self.master)
@@ -63,9 +370,12 @@ class DataProcessorGUI:
         frame_plot = tk.Frame(self.master)
         frame_plot.pack(pady=10)
         
-        self.fig, self.ax = plt.subplots(figsize=(8,4))
+        # Plain Figure rather than pyplot: no global figure manager or GUI backend,
+        # the Tk canvas is the only place it is shown and savefig renders offscreen
+        self.fig = Figure(figsize=(8,4))
+        self.ax = self.fig.add_subplot()
         self.canvas = FigureCanvasTkAgg(self.fig, master=frame_plot)
-        self.canvas.draw()
+        self.canvas.draw_idle()
         self.canvas.get_tk_widget().pack()
         
         # Generate Report Button
@@ -86,39 +396,25 @@ class DataProcessorGUI:
             messagebox.showerror("Error", "Please select a CSV file first.")
             return
         
+        # Read and group in the worker; the Tk thread only polls for the result
+        self.btn_process.config(state=tk.DISABLED)
+        self.progress.start()
+        future = self.pool.submit(self.load_grouped, self.csv_file)
+        self.master.after(PROCESS_POLL_MS, self._poll_process, future)
+    
+    def _poll_process(self, future):
+        if not future.done():
+            self.master.after(PROCESS_POLL_MS, self._poll_process, future)
+            return
+        self.progress.stop()
+        self.btn_process.config(state=tk.NORMAL)
+        
         try:
-            # Detect header row by searching for the processed data header
-            header_identifier = "Time,Metric,Value,Measurement,InfluxDB Field Name,Available in Valid File?,CAN Dictionary MAP,Time ,Expected Count,Loss,Percentage Loss"
-            with open(self.csv_file, 'r', encoding='utf-8') as f:
-                for idx, line in enumerate(f):
-                    if line.strip().startswith("Time,Metric,Value,Measurement"):
-                        header_row = idx
-                        break
-                else:
-                    messagebox.showerror("Error", "Header row not found in the CSV file.")
-                    return
-            
-            # Read the CSV, skipping metadata rows
-            df = pd.read_csv(
-                self.csv_file,
-                skiprows=range(0, header_row),
-                header=0,
-                encoding="utf-8"
-            )
-            
-            # Data Cleaning
-            df['Percentage Loss'] = pd.to_numeric(df['Percentage Loss'], errors='coerce')
-            initial_row_count = df.shape[0]
-            df = df.dropna(subset=['Percentage Loss'])
-            cleaned_row_count = df.shape[0]
-            dropped_rows = initial_row_count - cleaned_row_count
+            grouped, dropped_rows = future.result()
             
             if dropped_rows > 0:
                 messagebox.showwarning("Warning", f"Dropped {dropped_rows} rows due to invalid 'Percentage Loss' values.")
             
-            # Grouping
-            grouped = df.groupby("Measurement")["Percentage Loss"].agg(['min', 'max']).reset_index()
-            grouped.rename(columns={'min': 'Min Loss', 'max': 'Max Loss'}, inplace=True)
             self.grouped_data = grouped
             
             # Update Treeview
@@ -129,43 +425,159 @@ class DataProcessorGUI:
             
             messagebox.showinfo("Success", "Data processed successfully.")
         
+        except DataFileError as e:
+            messagebox.showerror("Error", str(e))
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred while processing the data:\n{e}")
     
+    def load_grouped(self, csv_file):
+        """
+        Reads csv_file and takes the min and max loss per measurement.
+        Runs in the worker thread, so it must not touch Tk.
+        Returns (grouped, dropped_rows).
+        """
+        # Reuse the Parquet cache of an unchanged file instead of parsing it again
+        cache_path = sidecar_path(csv_file) if pa is not None else None
+        result = read_sidecar(cache_path) if cache_path else None
+        if result is None:
+            result = self.read_data(csv_file)
+            if cache_path:
+                write_sidecar(csv_file, cache_path, *result)
+        df, dropped_rows = result
+        
+        # Grouping
+        grouped = group_min_max(df['Measurement'], df['Percentage Loss'].to_numpy())
+        return grouped, dropped_rows
+    
+    def read_data(self, csv_file):
+        """
+        Reads Measurement and Percentage Loss from the CSV and drops the rows
+        without a numeric loss. Returns (df, dropped_rows), or raises
+        DataFileError if the file can't be used.
+        """
+        # Detect header row by searching for the processed data header
+        header_row = find_header_row(csv_file)
+        if header_row is None:
+            raise DataFileError("Header row not found in the CSV file.")
+        
+        result = read_data_arrow(csv_file, header_row) if pa is not None else None
+        if result is None:
+            # Read the CSV, skipping metadata rows; the other columns are never
+            # tokenized into values. A callable usecols doesn't raise on a missing
+            # column, which is reported below instead
+            df = pd.read_csv(
+                csv_file,
+                skiprows=range(0, header_row),
+                header=0,
+                usecols=lambda col: col in REQUIRED_COLUMNS,
+                dtype={'Measurement': 'category'},  # Integer codes plus one copy of each label
+                encoding="utf-8",
+                engine="c"
+            )
+            
+            missing = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+            if missing:
+                raise DataFileError(f"CSV file must contain the following columns: {', '.join(missing)}")
+            
+            # Data Cleaning
+            result = clean_losses(df)
+        return result
+    
     def update_table(self, data):
-        # Clear existing data
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Clear existing data in one call
+        self.tree.delete(*self.tree.get_children())
+        
+        # Insert new data, zipping the column arrays instead of building a Series per row
+        detach = len(data) > TREE_DETACH_ROWS
+        if detach:
+            self.tree.pack_forget()
+        
+        insert = self.tree.insert
+        for values in zip(data['Measurement'].to_numpy(), data['Min Loss'].to_numpy(), data['Max Loss'].to_numpy()):
+            insert("", tk.END, values=values)
         
-        # Insert new data
-        for _, row in data.iterrows():
-            self.tree.insert("", tk.END, values=(row['Measurement'], row['Min Loss'], row['Max Loss']))
+        if detach:
+            self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
     
     def generate_plot(self, data):
-        self.ax.clear()
-        
-        # Set positions and width for the bars
-        import numpy as np
-        x = np.arange(len(data))
-        width = 0.35
-        
-        # Plot min and max losses
-        self.ax.bar(x - width/2, data['Min Loss'], width, label='Min Loss')
-        self.ax.bar(x + width/2, data['Max Loss'], width, label='Max Loss')
-        
-        # Labels and titles
-        self.ax.set_xlabel('Measurement')
-        self.ax.set_ylabel('Percentage Loss')
-        self.ax.set_title('Minimum and Maximum Percentage Loss per Measurement')
-        self.ax.set_xticks(x)
-        self.ax.set_xticklabels(data['Measurement'], rotation=45, ha='right')
-        self.ax.legend()
-        
-        self.fig.tight_layout()
-        self.canvas.draw()
+        labels = data['Measurement'].tolist()
         
-        # Save plot as image for PDF
-        self.fig.savefig(self.plot_path)
+        if self.bars_min is not None and len(self.bars_min) == len(data):
+            # Same number of bars: change their heights instead of rebuilding the chart
+            ylim = self.ax.get_ylim()
+            for rect, h in zip(self.bars_min, data['Min Loss'].to_numpy()):
+                rect.set_height(h)
+            for rect, h in zip(self.bars_max, data['Max Loss'].to_numpy()):
+                rect.set_height(h)
+            self.ax.relim()
+            self.ax.autoscale_view()
+            
+            same_labels = labels == self.plot_labels
+            if (same_labels and self.ax.get_ylim() == ylim
+                    and self.background_size == self.canvas.get_width_height()):
+                # Nothing outside the bars moved: repaint only the axes
+                self.blit_bars()
+            else:
+                # The tick label Text objects are only rebuilt when the labels change
+                if not same_labels:
+                    self.ax.set_xticklabels(labels, rotation=45, ha='right')
+                self.fig.tight_layout()
+                self.redraw_plot()
+        else:
+            self.ax.clear()
+            
+            # Set positions and width for the bars
+            x = np.arange(len(data))
+            width = 0.35
+            
+            # Plot min and max losses
+            self.bars_min = self.ax.bar(x - width/2, data['Min Loss'], width, label='Min Loss')
+            self.bars_max = self.ax.bar(x + width/2, data['Max Loss'], width, label='Max Loss')
+            
+            # Labels and titles
+            self.ax.set_xlabel('Measurement')
+            self.ax.set_ylabel('Percentage Loss')
+            self.ax.set_title('Minimum and Maximum Percentage Loss per Measurement')
+            self.ax.set_xticks(x)
+            self.ax.set_xticklabels(labels, rotation=45, ha='right')
+            self.ax.legend()
+            
+            self.fig.tight_layout()
+            self.redraw_plot()
+        self.plot_labels = labels
+    
+    def redraw_plot(self):
+        """
+        Draws the whole figure, keeping the axes without the bars, spines and
+        legend as the background later bar updates are blitted onto.
+        """
+        artists = [*self.bars_min, *self.bars_max, *self.ax.spines.values(), self.ax.get_legend()]
+        for artist in artists:
+            artist.set_visible(False)
+        self.canvas.draw()
+        self.background = self.canvas.copy_from_bbox(self.blit_box())
+        self.background_size = self.canvas.get_width_height()
+        for artist in artists:
+            artist.set_visible(True)
+        self.blit_bars()
+    
+    def blit_bars(self):
+        """
+        Repaints the axes from the saved background with the current bars,
+        then the spines and legend that sit above them.
+        """
+        self.canvas.restore_region(self.background)
+        for rect in [*self.bars_min, *self.bars_max]:
+            self.ax.draw_artist(rect)
+        for spine in self.ax.spines.values():
+            self.ax.draw_artist(spine)
+        self.ax.draw_artist(self.ax.get_legend())
+        self.canvas.blit(self.blit_box())
+    
+    def blit_box(self):
+        # The axes plus a margin for the half of each spine that lies outside it;
+        # drawing a spine twice would darken its antialiased edge
+        return self.ax.bbox.padded(3)
     
     def generate_report(self):
         if self.grouped_data.empty:
@@ -182,50 +594,52 @@ class DataProcessorGUI:
             if not report_path:
                 return  # User cancelled
             
-            c = canvas.Canvas(report_path, pagesize=letter)
-            width, height = letter
-            styles = getSampleStyleSheet()
-            styleN = styles['Normal']
-            styleH = styles['Heading1']
+            # Flowables let ReportLab lay the table out page by page
+            doc = SimpleDocTemplate(report_path, pagesize=letter)
+            styles = _STYLES
+            elements = []
             
             # Title
-            c.setFont("Helvetica-Bold", 20)
-            c.drawCentredString(width / 2, height - 50, "Data Processing Report")
-            
-            # Spacer
-            c.setFont("Helvetica", 12)
-            c.drawString(50, height - 80, f"Report generated on: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            
-            # Table Data
-            data = [self.grouped_data.columns.tolist()] + self.grouped_data.values.tolist()
-            table = Table(data, colWidths=[250, 100, 100])
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0,0), (-1,0), colors.grey),
-                ('TEXTCOLOR',(0,0),(-1,0),colors.whitesmoke),
-                ('ALIGN',(0,0),(-1,-1),'CENTER'),
-                ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-                ('BOTTOMPADDING', (0,0), (-1,0), 12),
-                ('BACKGROUND',(0,1),(-1,-1),colors.beige),
-                ('GRID', (0,0), (-1,-1), 1, colors.black),
-            ]))
-            
-            # Position the table
-            table_width, table_height = table.wrap(0, 0)
-            table.drawOn(c, 50, height - 150 - table_height)
-            
-            # Spacer
-            y_position = height - 160 - table_height
-            
-            # Add the plot image
-            if os.path.exists(self.plot_path):
-                c.drawImage(self.plot_path, 50, y_position - 300, width=500, height=300)
-                y_position -= 320  # Adjust y position after the image
+            elements.append(Paragraph("Data Processing Report", styles['Title']))
+            
+            # Timestamp
+            elements.append(Paragraph(f"Report generated on: {time.strftime(TIMESTAMP_FORMAT)}", styles['Normal']))
+            elements.append(Spacer(1, 12))
+            
+            # Table Data; LongTable with fixed widths and heights splits across pages
+            # and repeats the header row without measuring every cell up front
+            data = [self.grouped_data.columns.tolist()] + self.grouped_data.to_numpy().tolist()
+            n_rows = len(self.grouped_data)
+            # Nearby sizes share a cached layout
+            style, col_widths, row_heights = _layout_for(1 << n_rows.bit_length())
+            labels = self.grouped_data['Measurement']
+            if not pd.api.types.is_numeric_dtype(labels) and labels.astype(str).str.contains('\n').any():
+                row_heights = None  # Multi-line labels need their rows measured
+            else:
+                row_heights = row_heights[:n_rows + 1]
+            table = LongTable(data, colWidths=col_widths, rowHeights=row_heights, repeatRows=1, splitByRow=1)
+            table.setStyle(style)
+            elements.append(table)
+            elements.append(Spacer(1, 12))
+            
+            # Add the plot image, rendered in memory only now that a report needs it:
+            # as SVG vector graphics with svglib, else as PNG
+            plot = io.BytesIO()
+            if svg2rlg is not None:
+                self.fig.savefig(plot, format='svg')
+                plot.seek(0)
+                drawing = svg2rlg(plot)
+                # Stretch to the same 500x300 box the PNG is drawn into
+                drawing.scale(500 / drawing.width, 300 / drawing.height)
+                drawing.width, drawing.height = 500, 300
+                elements.append(drawing)
             else:
-                c.drawString(50, y_position - 20, "Plot image not found.")
-                y_position -= 30
+                self.fig.savefig(plot, format='png')
+                plot.seek(0)
+                elements.append(Image(plot, width=500, height=300))
             
             # Save the PDF
-            c.save()
+            doc.build(elements)
             messagebox.showinfo("Success", f"Report generated successfully at:\n{report_path}")
         
         except Exception as e:
@@ -1,5 +1,6 @@
 import sys
 import os
+import glob
 import tkinter
 from cx_Freeze import setup, Executable
 
@@ -22,6 +23,13 @@ tcl_dir = root.tk.exprstring('$tcl_library')
 tk_dir = root.tk.exprstring('$tk_library')
 root.destroy()  # Close the Tkinter window as we don't need it here
 
+# Ship the AOT-compiled kernel (python aot_build.py) when it has been built; 1.0.7.py
+# imports it from lib, which is on the frozen executable's module path
+aot_kernels = [
+    (kernel, os.path.join('lib', kernel))
+    for kernel in glob.glob('groupby_kernels*.pyd') + glob.glob('groupby_kernels*.so')
+]
+
 # Define build options
 build_exe_options = {
     'packages': ['numpy', 'pandas', 'openpyxl'],
@@ -31,7 +39,7 @@ build_exe_options = {
         (tcl_dir, os.path.join('lib', 'tcl')),  # Include Tcl library
         (tk_dir, os.path.join('lib', 'tk')),    # Include Tk library
         # 'app_icon.ico',  # Optional: Include your application icon
-    ],
+    ] + aot_kernels,
     'include_msvcr': True,  # Include Microsoft Visual C++ Redistributables
     'excludes': [],  # Do not exclude essential modules
 }